@@ -20,7 +20,7 @@ setup(
     install_requires=[],  # Zero dependencies
     entry_points={
         "console_scripts": [
-            "sqliteexplorer=sqliteexplorer:main",
+            "sqliteexplorer=sqliteexplorer:_cli",
         ],
     },
     classifiers=[
@@ -15,18 +15,24 @@ Date: February 14, 2026
 License: MIT
 """
 
-import argparse
-import csv
 import io
-import json
 import os
-import shutil
 import sqlite3
 import sys
-import textwrap
+from array import array
+from collections import defaultdict
+from copy import deepcopy
 from datetime import datetime
+from functools import lru_cache, singledispatch
+from itertools import chain, islice, zip_longest
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import (TYPE_CHECKING, Any, Dict, Iterable, List, Optional,
+                    Sequence, TextIO, Tuple, Union)
+
+if TYPE_CHECKING:
+    # Imported lazily at run time; named here for the annotations only
+    import argparse
+    import json
 
 
 __version__ = "1.0.0"
@@ -37,22 +43,210 @@ __author__ = "ATLAS (Team Brain)"
 # TABLE FORMATTER
 # =============================================================================
 
+# Escape table for embedded line breaks in text cells and headers
+_NEWLINE_ESCAPES = str.maketrans({"\n": "\\n", "\r": "\\r"})
+
+# Escape table for pipe characters inside Markdown cells
+_MD_ESCAPES = str.maketrans({"|": "\\|"})
+
+# Number of leading rows inspected when choosing a column's alignment
+_ALIGN_SAMPLE_ROWS = 64
+
+_NUMERIC_TYPES = {int, float}
+
+# Rows converted per csv writerows() call when streaming
+_CSV_BATCH_ROWS = 1024
+
+# Rows fetched per batch by SQLiteExplorer.query_columns()
+_COLUMN_BATCH_ROWS = 1024
+
+
+def _cell_text(val: Any) -> str:
+    """Render a single value for the aligned text table."""
+    if val is None:
+        return "NULL"
+    if isinstance(val, bytes):
+        return "<BLOB %d bytes>" % len(val)
+    if isinstance(val, float):
+        return "%.6g" % val
+    return str(val).translate(_NEWLINE_ESCAPES)
+
+
+# Type-specialized renderers: each column gets the one matching its sampled
+# type, so the hot loop sees a single type check per cell (monomorphic,
+# which also suits PyPy's tracing JIT). Stray values fall back to
+# _cell_text, since SQLite columns can hold any type.
+
+def _float_text(val: Any) -> str:
+    """Render a value from a float column."""
+    if type(val) is float:
+        return "%.6g" % val
+    return _cell_text(val)
+
+
+def _int_text(val: Any) -> str:
+    """Render a value from an integer column."""
+    if type(val) is int:
+        return str(val)
+    return _cell_text(val)
+
+
+def _str_text(val: Any) -> str:
+    """Render a value from a text column."""
+    if type(val) is str:
+        return val.translate(_NEWLINE_ESCAPES)
+    return _cell_text(val)
+
+
+def _blob_text(val: Any) -> str:
+    """Render a value from a BLOB column."""
+    if type(val) is bytes:
+        return "<BLOB %d bytes>" % len(val)
+    return _cell_text(val)
+
+
+_CELL_RENDERERS = {
+    float: _float_text,
+    int: _int_text,
+    str: _str_text,
+    bytes: _blob_text,
+}
+
+
+def _column_kinds(col_count: int, rows: List[List[Any]]) -> List[Optional[type]]:
+    """
+    Infer each column's value type from a sample of rows.
+
+    NULLs and empty strings carry no type information and are ignored.
+    Columns mixing ints and floats are reported as float; any other
+    disagreement (or an all-NULL sample) yields None.
+
+    Args:
+        col_count: Number of columns in the table.
+        rows: Row data (only the first few rows are inspected).
+
+    Returns:
+        List with one type (or None) per column.
+    """
+    kinds = [None] * col_count
+    mixed = [False] * col_count
+    for row in rows[:_ALIGN_SAMPLE_ROWS]:
+        for i, val in enumerate(row[:col_count]):
+            if val is None or val == "" or mixed[i]:
+                continue
+            kind = type(val)
+            if kinds[i] is None:
+                kinds[i] = kind
+            elif kinds[i] is not kind:
+                if {kinds[i], kind} <= _NUMERIC_TYPES:
+                    kinds[i] = float
+                else:
+                    kinds[i] = None
+                    mixed[i] = True
+    return kinds
+
+
+def _table_frame(headers: List[str], col_widths: List[int]) -> Tuple[str, str]:
+    """Build the +---+ separator and the padded header line of a text table."""
+    sep = "+" + "+".join("-" * (w + 2) for w in col_widths) + "+"
+    header_line = "| " + " | ".join(
+        (h if len(h) <= w else "%.*s..." % (w - 3, h)).ljust(w)
+        for h, w in zip(headers, col_widths)
+    ) + " |"
+    return sep, header_line
+
+
+def _csv_value(val: Any) -> Any:
+    """
+    Prepare a value for csv.writer.
+
+    Only BLOBs need rewriting; csv.writer renders None as "" and
+    stringifies numbers itself, so everything else passes through.
+    """
+    if type(val) is bytes:
+        return "<BLOB %d bytes>" % len(val)
+    return val
+
+
+def _extend_column(column: Union[array, list],
+                   values: Sequence[Any]) -> Union[array, list]:
+    """
+    Append a batch of values to a column, widening its storage as needed.
+
+    array('q') stays as long as only integers arrive, widens to array('d')
+    once floats appear, and falls back to a list for any other value
+    (values already widened to float stay floats in that list).
+
+    Returns:
+        The column to keep using (possibly a new, wider object).
+    """
+    if type(column) is list:
+        column.extend(values)
+        return column
+    kinds = set(map(type, values))
+    if kinds <= _NUMERIC_TYPES:
+        if column.typecode == "q" and float in kinds:
+            column = array("d", column)
+        column.extend(values)
+        return column
+    column = column.tolist()
+    column.extend(values)
+    return column
+
+
+def _md_cell(val: Any) -> str:
+    """Render a single value for a Markdown table cell."""
+    if val is None:
+        return "NULL"
+    if isinstance(val, bytes):
+        return "`<BLOB %d bytes>`" % len(val)
+    return str(val).translate(_MD_ESCAPES)
+
+
+@singledispatch
+def _json_default(obj: Any) -> Any:
+    """Serialize values json can't handle natively (fallback: str)."""
+    return str(obj)
+
+
+@_json_default.register(bytes)
+def _(obj: bytes) -> str:
+    return "<BLOB %d bytes>" % len(obj)
+
+
+@_json_default.register(datetime)
+def _(obj: datetime) -> str:
+    return obj.isoformat()
+
+
+@lru_cache(maxsize=None)
+def _json_encoder(indent: Optional[int]) -> "json.JSONEncoder":
+    """Return a shared encoder; json.dumps builds a new one per call."""
+    import json
+
+    return json.JSONEncoder(indent=indent, default=_json_default,
+                            ensure_ascii=False)
+
+
 class TableFormatter:
     """Format tabular data for terminal, JSON, CSV, and Markdown output."""
 
     @staticmethod
     def format_table(
         headers: List[str],
-        rows: List[List[Any]],
+        rows: Iterable[Sequence[Any]],
         max_width: int = 40,
         title: str = None,
     ) -> str:
         """
         Format data as an aligned text table.
 
+        Rows may be any iterable (e.g. a generator); they are consumed once
+        and only their rendered strings are kept for the width pass.
+
         Args:
             headers: Column header names.
-            rows: List of row data (each row is a list).
+            rows: Iterable of row data (each row is a sequence).
             max_width: Maximum column width before truncation.
             title: Optional title displayed above the table.
 
@@ -61,83 +255,75 @@ class TableFormatter:
         """
         if not headers:
             return "(no columns)"
-        if not rows:
-            rows_display = []
-        else:
-            rows_display = rows
-
-        # Stringify all values
-        str_headers = [str(h) for h in headers]
-        str_rows = []
-        for row in rows_display:
-            str_row = []
-            for val in row:
-                if val is None:
-                    str_row.append("NULL")
-                elif isinstance(val, bytes):
-                    str_row.append("<BLOB %d bytes>" % len(val))
-                elif isinstance(val, float):
-                    str_row.append("%.6g" % val)
-                else:
-                    s = str(val)
-                    # Replace newlines for display
-                    s = s.replace("\n", "\\n").replace("\r", "\\r")
-                    str_row.append(s)
-            str_rows.append(str_row)
-
-        # Calculate column widths
+        row_iter = iter(rows)
+        sample = list(islice(row_iter, _ALIGN_SAMPLE_ROWS))
+        if not sample:
+            return TableFormatter._format_header_only(headers, max_width, title)
+
+        # Stringify all values. Column types are decided once up front from
+        # the sample; they pick both the cell renderer and the alignment
+        # instead of probing every cell.
+        str_headers = [str(h).translate(_NEWLINE_ESCAPES) for h in headers]
+        kinds = _column_kinds(len(str_headers), sample)
+        numeric = [k is int or k is float for k in kinds]
+        converters = [_CELL_RENDERERS.get(k, _cell_text) for k in kinds]
+        str_rows = [
+            [conv(val) for conv, val in zip(converters, row)]
+            for row in chain(sample, row_iter)
+        ]
+
+        # Calculate column widths (transposed so max/len run per column)
         col_widths = [len(h) for h in str_headers]
-        for row in str_rows:
-            for i, val in enumerate(row):
-                if i < len(col_widths):
-                    col_widths[i] = max(col_widths[i], len(val))
+        if len(str_rows) == 1:
+            for i, val in enumerate(str_rows[0]):
+                col_widths[i] = max(col_widths[i], len(val))
+        else:
+            for i, col in enumerate(zip_longest(*str_rows, fillvalue="")):
+                col_widths[i] = max(col_widths[i], max(map(len, col)))
 
         # Apply max width
         col_widths = [min(w, max_width) for w in col_widths]
+        col_count = len(col_widths)
 
-        # Truncate values
-        def truncate(s: str, width: int) -> str:
-            if len(s) <= width:
-                return s
-            return s[: width - 3] + "..."
-
-        # Build separator
-        sep = "+-" + "-+-".join("-" * w for w in col_widths) + "-+"
-
-        lines = []
-        if title:
-            lines.append("")
-            lines.append(title)
+        # Separator and header
+        sep, header_line = _table_frame(str_headers, col_widths)
 
-        # Header
-        lines.append(sep)
-        header_line = "| " + " | ".join(
-            truncate(h, w).ljust(w) for h, w in zip(str_headers, col_widths)
+        # Rows: one %-template per table, numeric columns right-aligned
+        row_fmt = "| " + " | ".join(
+            ("%%%ds" if is_num else "%%-%ds") % w
+            for w, is_num in zip(col_widths, numeric)
         ) + " |"
-        lines.append(header_line)
-        lines.append(sep)
-
-        # Rows
-        for row in str_rows:
-            padded = []
-            for i, w in enumerate(col_widths):
-                val = row[i] if i < len(row) else ""
-                val = truncate(val, w)
-                # Right-align if it looks numeric
-                try:
-                    float(row[i] if i < len(row) else "x")
-                    padded.append(val.rjust(w))
-                except (ValueError, IndexError):
-                    padded.append(val.ljust(w))
-            lines.append("| " + " | ".join(padded) + " |")
 
+        def fit(row: List[str]) -> tuple:
+            # Only over-long cells are copied (slice and ellipsis in one
+            # %-call); padding happens in row_fmt
+            cells = [
+                val if len(val) <= w else "%.*s..." % (w - 3, val)
+                for val, w in zip(row, col_widths)
+            ]
+            if len(cells) < col_count:
+                cells.extend([""] * (col_count - len(cells)))
+            return tuple(cells)
+
+        # Assemble with bulk extends and a single join
+        lines = ["", title] if title else []
+        lines += [sep, header_line, sep]
+        lines.extend(row_fmt % fit(row) for row in str_rows)
         lines.append(sep)
 
-        if str_rows:
-            lines.append("(%d row%s)" % (len(str_rows), "s" if len(str_rows) != 1 else ""))
-        else:
-            lines.append("(0 rows)")
+        lines.append("(%d row%s)" % (len(str_rows), "s" if len(str_rows) != 1 else ""))
+
+        return "\n".join(lines)
 
+    @staticmethod
+    def _format_header_only(headers: List[str], max_width: int,
+                            title: Optional[str]) -> str:
+        """Format a table with no rows (widths come from headers alone)."""
+        str_headers = [str(h).translate(_NEWLINE_ESCAPES) for h in headers]
+        col_widths = [min(len(h), max_width) for h in str_headers]
+        sep, header_line = _table_frame(str_headers, col_widths)
+        lines = ["", title] if title else []
+        lines += [sep, header_line, sep, sep, "(0 rows)"]
         return "\n".join(lines)
 
     @staticmethod
@@ -152,17 +338,44 @@ class TableFormatter:
         Returns:
             JSON string.
         """
-        def default_serializer(obj):
-            if isinstance(obj, bytes):
-                return "<BLOB %d bytes>" % len(obj)
-            if isinstance(obj, datetime):
-                return obj.isoformat()
-            if isinstance(obj, Path):
-                return str(obj)
-            return str(obj)
+        return _json_encoder(indent).encode(data)
 
-        return json.dumps(data, indent=indent, default=default_serializer,
-                          ensure_ascii=False)
+    @staticmethod
+    def format_json_stream(records: Iterable[Any], fp: TextIO,
+                           indent: int = 2) -> None:
+        """
+        Write an iterable of records as a JSON array, one record at a time.
+
+        The output is identical to format_json(list(records), indent), but
+        only one encoded record is held in memory at once.
+
+        Args:
+            records: Iterable of JSON-serializable records.
+            fp: Writable text stream.
+            indent: JSON indentation level.
+        """
+        encoder = _json_encoder(indent)
+        pad = " " * indent
+        first = True
+        for record in records:
+            # Structural newlines only: string values have theirs escaped
+            fp.write(("[\n" if first else ",\n") + pad
+                     + encoder.encode(record).replace("\n", "\n" + pad))
+            first = False
+        fp.write("[]" if first else "\n]")
+
+    @staticmethod
+    def format_jsonl_stream(records: Iterable[Any], fp: TextIO) -> None:
+        """
+        Write records as JSON Lines: one compact JSON document per line.
+
+        Args:
+            records: Iterable of JSON-serializable records.
+            fp: Writable text stream.
+        """
+        encode = _json_encoder(None).encode
+        for record in records:
+            fp.write(encode(record) + "\n")
 
     @staticmethod
     def format_csv_str(headers: List[str], rows: List[List[Any]]) -> str:
@@ -177,66 +390,261 @@ class TableFormatter:
             CSV formatted string.
         """
         output = io.StringIO()
-        writer = csv.writer(output)
-        writer.writerow(headers)
-        for row in rows:
-            csv_row = []
-            for val in row:
-                if val is None:
-                    csv_row.append("")
-                elif isinstance(val, bytes):
-                    csv_row.append("<BLOB %d bytes>" % len(val))
-                else:
-                    csv_row.append(str(val))
-            writer.writerow(csv_row)
+        TableFormatter.format_csv_stream(headers, rows, output)
         return output.getvalue()
 
     @staticmethod
-    def format_markdown(headers: List[str], rows: List[List[Any]]) -> str:
+    def format_csv_stream(headers: List[str], rows: Iterable[Sequence[Any]],
+                          fp: TextIO) -> None:
+        """
+        Write data as CSV incrementally to a text stream.
+
+        Rows are converted one at a time, so any iterable (including a
+        sqlite3 cursor) can be written without materializing it.
+
+        Args:
+            headers: Column headers.
+            rows: Iterable of row data.
+            fp: Writable text stream (files should be opened with newline="").
+        """
+        import csv
+
+        writer = csv.writer(fp)
+        writer.writerow(headers)
+        # Convert rows in fixed-size batches so each writerows() call
+        # covers many rows while memory stays bounded for cursor input.
+        row_iter = iter(rows)
+        while True:
+            batch = [
+                [_csv_value(val) for val in row]
+                for row in islice(row_iter, _CSV_BATCH_ROWS)
+            ]
+            if not batch:
+                break
+            writer.writerows(batch)
+
+    @staticmethod
+    def format_markdown(headers: List[str],
+                        rows: Iterable[Sequence[Any]]) -> str:
         """
         Format data as a Markdown table.
 
         Args:
             headers: Column headers.
-            rows: Row data.
+            rows: Iterable of row data.
 
         Returns:
             Markdown table string.
         """
+        output = io.StringIO()
+        TableFormatter.format_markdown_stream(headers, rows, output)
+        return output.getvalue()
+
+    @staticmethod
+    def format_markdown_stream(headers: List[str],
+                               rows: Iterable[Sequence[Any]],
+                               fp: TextIO) -> None:
+        """
+        Write data as a Markdown table incrementally to a text stream.
+
+        Args:
+            headers: Column headers.
+            rows: Iterable of row data.
+            fp: Writable text stream.
+        """
         if not headers:
-            return "(no columns)"
+            fp.write("(no columns)")
+            return
 
-        # Stringify
         str_headers = [str(h) for h in headers]
-        str_rows = []
-        for row in rows:
-            str_row = []
-            for val in row:
-                if val is None:
-                    str_row.append("NULL")
-                elif isinstance(val, bytes):
-                    str_row.append("`<BLOB %d bytes>`" % len(val))
-                else:
-                    s = str(val).replace("|", "\\|")
-                    str_row.append(s)
-            str_rows.append(str_row)
+        col_count = len(str_headers)
 
-        lines = []
-        lines.append("| " + " | ".join(str_headers) + " |")
-        lines.append("| " + " | ".join("---" for _ in str_headers) + " |")
-        for row in str_rows:
+        fp.write("| " + " | ".join(str_headers) + " |\n")
+        fp.write("| " + " | ".join("---" for _ in str_headers) + " |")
+        for row in rows:
+            cells = [_md_cell(val) for val in row]
             # Pad row if shorter than headers
-            while len(row) < len(str_headers):
-                row.append("")
-            lines.append("| " + " | ".join(row) + " |")
+            if len(cells) < col_count:
+                cells.extend([""] * (col_count - len(cells)))
+            fp.write("\n| " + " | ".join(cells) + " |")
 
-        return "\n".join(lines)
+
+# Module-level aliases so the CLI display helpers call the formatters
+# without a global-plus-attribute lookup each time
+_fmt_json = TableFormatter.format_json
+_fmt_table = TableFormatter.format_table
+_fmt_md = TableFormatter.format_markdown
+
+
+# Results larger than this bypass the formatter cache
+_FORMAT_CACHE_MAX_ROWS = 256
+
+
+def _format_memoized(formatter, headers: List[str], rows: List[List[Any]],
+                     *args) -> str:
+    """
+    Format a small table through an LRU cache keyed on its contents.
+
+    Meant for metadata listings (schema columns, table summaries) that are
+    re-rendered with identical content. Values are keyed together with
+    their type so that e.g. 1, 1.0 and True don't share an entry. Large or
+    unhashable results are formatted directly.
+
+    Args:
+        formatter: TableFormatter.format_table or format_markdown.
+        headers: Column headers.
+        rows: Row data.
+        *args: Extra positional arguments passed to the formatter.
+
+    Returns:
+        Formatted string.
+    """
+    if len(rows) > _FORMAT_CACHE_MAX_ROWS:
+        return formatter(headers, rows, *args)
+    key = (
+        tuple(headers),
+        tuple(tuple((type(v), v) for v in row) for row in rows),
+    )
+    try:
+        return _format_cached(formatter, key, args)
+    except TypeError:
+        return formatter(headers, rows, *args)
+
+
+@lru_cache(maxsize=64)
+def _format_cached(formatter, key: tuple, args: tuple) -> str:
+    headers, typed_rows = key
+    rows = [[v for _, v in row] for row in typed_rows]
+    return formatter(list(headers), rows, *args)
 
 
 # =============================================================================
 # SQLITE EXPLORER
 # =============================================================================
 
+# Applied to every read-only connection: a 64 MiB page cache, 256 MiB of
+# memory-mapped I/O and in-memory temp tables keep repeated introspection
+# queries off the disk; query_only guards against accidental writes.
+_READ_PRAGMAS = (
+    "PRAGMA cache_size=-65536;"
+    "PRAGMA mmap_size=268435456;"
+    "PRAGMA temp_store=MEMORY;"
+    "PRAGMA query_only=1;"
+)
+
+
+# Per-column aggregates computed by get_stats(), in result-tuple order
+_STATS_AGGREGATES = (
+    'COUNT("%s")',
+    'COUNT(DISTINCT "%s")',
+    'MIN("%s")',
+    'MAX("%s")',
+    'AVG("%s")',
+    'SUM("%s")',
+)
+
+# Table columns aggregated per stats SELECT, keeping the result set (one
+# COUNT(*) plus one group per column) under SQLite's default
+# SQLITE_MAX_COLUMN of 2000
+_STATS_BATCH_COLUMNS = (2000 - 1) // len(_STATS_AGGREGATES)
+
+
+def _stats_sql(table: str, columns: Sequence[str], with_sum: bool = True) -> str:
+    """Build one SELECT that aggregates every column of a table.
+
+    Args:
+        table: Table name.
+        columns: Column names, in output order.
+        with_sum: If False, select NULL in place of each SUM().
+
+    Returns:
+        SQL returning COUNT(*) followed by one group of
+        _STATS_AGGREGATES per column.
+    """
+    templates = _STATS_AGGREGATES if with_sum else _STATS_AGGREGATES[:-1] + ("NULL",)
+    aggregates = ["COUNT(*)"]
+    for col in columns:
+        aggregates.extend(
+            t % col if "%s" in t else t for t in templates
+        )
+    return 'SELECT %s FROM "%s"' % (", ".join(aggregates), table)
+
+
+# Applied before VACUUM: a 256 MiB page cache for copying the b-trees.
+# synchronous and journal_mode are left alone, since VACUUM rewrites every
+# page of the user's file and journal_mode=WAL would persist after it.
+_VACUUM_PRAGMAS = "PRAGMA cache_size=-262144;"
+
+# Everything get_info() reads from the database, as a single row
+_INFO_SQL = (
+    "SELECT sqlite_version(), "
+    "(SELECT page_size FROM pragma_page_size), "
+    "(SELECT page_count FROM pragma_page_count), "
+    "(SELECT freelist_count FROM pragma_freelist_count), "
+    "(SELECT journal_mode FROM pragma_journal_mode), "
+    "(SELECT encoding FROM pragma_encoding), "
+    "COALESCE(SUM(type='table' AND name NOT LIKE 'sqlite_%'), 0), "
+    "COALESCE(SUM(type='index' AND name NOT LIKE 'sqlite_%'), 0), "
+    "COALESCE(SUM(type='view'), 0), "
+    "COALESCE(SUM(type='trigger'), 0) "
+    "FROM sqlite_master"
+)
+
+# Constant statement text (with any table name bound as a parameter), so the
+# sqlite3 statement cache can reuse one compiled statement for every table
+_TABLE_NAMES_SQL = (
+    "SELECT name, name NOT LIKE 'sqlite_%' FROM sqlite_master "
+    "WHERE type='table' ORDER BY name"
+)
+_TABLE_INFO_SQL = "SELECT * FROM pragma_table_info(?)"
+
+# A column c is searchable unless its declared type starts with a numeric,
+# boolean or BLOB affinity name (unknown types are searched)
+_TEXT_TYPE_TEST = "NOT (%s)" % " OR ".join(
+    "upper(c.type) GLOB '%s*'" % prefix
+    for prefix in ("INT", "REAL", "FLOAT", "DOUBLE", "NUMERIC", "BLOB",
+                   "BOOLEAN")
+)
+
+# Every table's columns with their searchable flag. Views are looked up one
+# at a time (_OBJECT_TEXT_COLUMNS_SQL), since a single view whose tables are
+# gone would make pragma_table_info fail this whole query.
+_TEXT_COLUMNS_SQL = (
+    "SELECT m.name, c.name, %s "
+    "FROM sqlite_master m, pragma_table_info(m.name) c "
+    "WHERE m.type='table' ORDER BY m.name, c.cid" % _TEXT_TYPE_TEST
+)
+_OBJECT_TEXT_COLUMNS_SQL = (
+    "SELECT c.name, %s FROM pragma_table_info(?) c ORDER BY c.cid"
+    % _TEXT_TYPE_TEST
+)
+
+# Compiled statements kept per connection (the sqlite3 default is 128)
+_CACHED_STATEMENTS = 256
+
+# Write buffer for export files, so large exports reach disk in big chunks
+_EXPORT_BUFFER_SIZE = 65536
+
+
+def _write_export(fp: TextIO, headers: List[str], rows: Iterable[Sequence],
+                  fmt: str) -> None:
+    """Stream export rows to fp in the given format (default: CSV)."""
+    # BLOBs are handled by the encoder's default hook (_json_default),
+    # so records are built straight from the row tuples
+    if fmt == "json":
+        TableFormatter.format_json_stream(
+            (dict(zip(headers, row)) for row in rows), fp
+        )
+    elif fmt == "jsonl":
+        TableFormatter.format_jsonl_stream(
+            (dict(zip(headers, row)) for row in rows), fp
+        )
+    elif fmt == "md":
+        TableFormatter.format_markdown_stream(headers, rows, fp)
+    else:  # csv
+        TableFormatter.format_csv_stream(headers, rows, fp)
+
+
 class SQLiteExplorer:
     """
     Smart SQLite Database Explorer.
@@ -253,12 +661,23 @@ class SQLiteExplorer:
         >>> db.close()
     """
 
-    def __init__(self, db_path: str):
+    def __init__(self, db_path: str, immutable: bool = False,
+                 exclusive_lock: bool = False):
         """
         Initialize SQLiteExplorer with a database path.
 
         Args:
             db_path: Path to the SQLite database file.
+            immutable: Open read-only connections with immutable=1, which
+                skips all file locking and change detection. Only for files
+                that nothing will modify while the explorer is open (CI
+                artifacts, snapshots); a change made anyway can produce
+                wrong results or errors.
+            exclusive_lock: Hold the shared read lock on rollback-journal
+                databases until close() instead of re-taking it for every
+                statement. Other connections cannot write while the
+                explorer is open, so this suits short-lived, one-shot use
+                such as the CLI.
 
         Raises:
             FileNotFoundError: If the database file does not exist.
@@ -275,7 +694,12 @@ class SQLiteExplorer:
         if not self.db_path.is_file():
             raise ValueError("Path is not a file: %s" % self.db_path)
 
+        self.immutable = immutable
+        self.exclusive_lock = exclusive_lock
         self._conn = None
+        self._table_names = None
+        self._schema_cache = {}
+        self._schema_cache_version = None
 
     def _connect(self, readonly: bool = True) -> sqlite3.Connection:
         """
@@ -293,23 +717,53 @@ class SQLiteExplorer:
         if readonly:
             # Use URI mode for read-only
             uri = "file:%s?mode=ro" % str(self.db_path).replace("\\", "/")
+            if self.immutable:
+                uri += "&immutable=1"
             try:
-                conn = sqlite3.connect(uri, uri=True)
+                conn = sqlite3.connect(uri, uri=True,
+                                       cached_statements=_CACHED_STATEMENTS)
             except sqlite3.OperationalError:
                 # Fallback if URI mode not supported
-                conn = sqlite3.connect(str(self.db_path))
+                conn = sqlite3.connect(str(self.db_path),
+                                       cached_statements=_CACHED_STATEMENTS)
+            conn.executescript(_READ_PRAGMAS)
+            if self.exclusive_lock and not self.immutable:
+                # Immutable files are read without any locks at all
+                self._lock_for_reading(conn)
         else:
-            conn = sqlite3.connect(str(self.db_path))
+            conn = sqlite3.connect(str(self.db_path),
+                                   cached_statements=_CACHED_STATEMENTS)
 
-        conn.row_factory = sqlite3.Row
+        # Rows stay plain tuples: every consumer indexes by position, so a
+        # sqlite3.Row per row would only be allocated to be thrown away
         self._conn = conn
         return conn
 
+    @staticmethod
+    def _lock_for_reading(conn: sqlite3.Connection) -> None:
+        """
+        Hold the shared read lock for the lifetime of the connection.
+
+        With locking_mode=EXCLUSIVE SQLite takes the file lock once instead
+        of acquiring and releasing it around every statement. Concurrent
+        readers are unaffected, but writers are blocked until close().
+        WAL databases are skipped: a read-only WAL connection cannot run
+        in exclusive mode while another connection has the WAL open.
+        """
+        if conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal":
+            return
+        conn.execute("PRAGMA locking_mode=EXCLUSIVE")
+        # Any read of the file acquires (and now keeps) the shared lock
+        conn.execute("SELECT COUNT(*) FROM sqlite_master").fetchone()
+
     def close(self):
         """Close the database connection."""
         if self._conn is not None:
             self._conn.close()
             self._conn = None
+            self._table_names = None
+            self._schema_cache = {}
+            self._schema_cache_version = None
 
     def __enter__(self):
         return self
@@ -318,6 +772,56 @@ class SQLiteExplorer:
         self.close()
         return False
 
+    def _require_table(self, cursor: sqlite3.Cursor, table: str) -> None:
+        """
+        Check that a table exists.
+
+        Names are remembered per connection, so repeat checks cost no
+        query. An unknown name refreshes the list once before failing,
+        which also picks up tables created since it was read.
+
+        Raises:
+            ValueError: If it does not, listing the available tables.
+        """
+        if self._table_names is not None and table in self._table_names:
+            return
+        cursor.execute(_TABLE_NAMES_SQL)
+        names = cursor.fetchall()
+        self._table_names = {name for name, _ in names}
+        if table not in self._table_names:
+            available = [name for name, is_user in names if is_user]
+            raise ValueError(
+                "Table '%s' not found. Available tables: %s"
+                % (table, ", ".join(available) if available else "(none)")
+            )
+
+    def _cached(self, key: Tuple, loader):
+        """
+        Memoize introspection results until the database changes.
+
+        Entries are keyed under PRAGMA schema_version (bumped by DDL) and
+        PRAGMA data_version (bumped when another connection commits), so a
+        stale row count or schema is never served. The cache is dropped
+        when the connection is closed.
+
+        Args:
+            key: Cache key for this result.
+            loader: Zero-argument callable that computes the result.
+
+        Returns:
+            The cached or freshly loaded result.
+        """
+        version = self._connect().execute(
+            "SELECT s.schema_version, d.data_version "
+            "FROM pragma_schema_version s, pragma_data_version d"
+        ).fetchone()
+        if version != self._schema_cache_version:
+            self._schema_cache = {}
+            self._schema_cache_version = version
+        if key not in self._schema_cache:
+            self._schema_cache[key] = loader()
+        return self._schema_cache[key]
+
     # -------------------------------------------------------------------------
     # INFO
     # -------------------------------------------------------------------------
@@ -329,58 +833,24 @@ class SQLiteExplorer:
         Returns:
             Dict with database info including path, size, tables, version.
         """
+        return dict(self._cached(("info",), self._load_info))
+
+    def _load_info(self) -> Dict[str, Any]:
+        """Read file metadata and database settings for get_info()."""
         conn = self._connect()
         cursor = conn.cursor()
 
         # File info
-        file_size = self.db_path.stat().st_size
-        modified = datetime.fromtimestamp(self.db_path.stat().st_mtime)
-
-        # SQLite version
-        cursor.execute("SELECT sqlite_version()")
-        sqlite_version = cursor.fetchone()[0]
-
-        # Page info
-        cursor.execute("PRAGMA page_size")
-        page_size = cursor.fetchone()[0]
-        cursor.execute("PRAGMA page_count")
-        page_count = cursor.fetchone()[0]
-        cursor.execute("PRAGMA freelist_count")
-        freelist_count = cursor.fetchone()[0]
-
-        # Journal mode
-        cursor.execute("PRAGMA journal_mode")
-        journal_mode = cursor.fetchone()[0]
-
-        # Encoding
-        cursor.execute("PRAGMA encoding")
-        encoding = cursor.fetchone()[0]
-
-        # Table count
-        cursor.execute(
-            "SELECT COUNT(*) FROM sqlite_master WHERE type='table' "
-            "AND name NOT LIKE 'sqlite_%'"
-        )
-        table_count = cursor.fetchone()[0]
-
-        # Index count
-        cursor.execute(
-            "SELECT COUNT(*) FROM sqlite_master WHERE type='index' "
-            "AND name NOT LIKE 'sqlite_%'"
-        )
-        index_count = cursor.fetchone()[0]
+        stat = self.db_path.stat()
+        file_size = stat.st_size
+        modified = datetime.fromtimestamp(stat.st_mtime)
 
-        # View count
-        cursor.execute(
-            "SELECT COUNT(*) FROM sqlite_master WHERE type='view'"
-        )
-        view_count = cursor.fetchone()[0]
-
-        # Trigger count
-        cursor.execute(
-            "SELECT COUNT(*) FROM sqlite_master WHERE type='trigger'"
-        )
-        trigger_count = cursor.fetchone()[0]
+        # Version, page and journal settings, and object counts in one
+        # statement (a single pass over sqlite_master for the counts)
+        cursor.execute(_INFO_SQL)
+        (sqlite_version, page_size, page_count, freelist_count,
+         journal_mode, encoding, table_count, index_count, view_count,
+         trigger_count) = cursor.fetchone()
 
         return {
             "path": str(self.db_path),
@@ -403,35 +873,49 @@ class SQLiteExplorer:
     # TABLES
     # -------------------------------------------------------------------------
 
-    def get_tables(self) -> List[Dict[str, Any]]:
+    def get_tables(self, approximate: bool = False) -> List[Dict[str, Any]]:
         """
         List all tables with row counts and column counts.
 
+        Args:
+            approximate: If True, read row counts from the dbstat virtual
+                table (B-tree leaf cell counts) instead of running a
+                COUNT(*) scan per table. Exact for ordinary rowid tables,
+                an undercount for WITHOUT ROWID tables. Falls back to
+                COUNT(*) when dbstat is not compiled in.
+
         Returns:
             List of dicts with table name, row_count, column_count.
         """
+        tables = self._cached(("tables", approximate),
+                              lambda: self._load_tables(approximate))
+        return [dict(t) for t in tables]
+
+    def _load_tables(self, approximate: bool) -> List[Dict[str, Any]]:
+        """Query table names, column counts and row counts for get_tables()."""
         conn = self._connect()
         cursor = conn.cursor()
 
+        # Names and column counts for every table in one statement
         cursor.execute(
-            "SELECT name FROM sqlite_master WHERE type='table' "
-            "AND name NOT LIKE 'sqlite_%' ORDER BY name"
+            "SELECT m.name, (SELECT COUNT(*) FROM pragma_table_info(m.name)) "
+            "FROM sqlite_master m WHERE m.type='table' "
+            "AND m.name NOT LIKE 'sqlite_%' ORDER BY m.name"
         )
-        table_names = [row[0] for row in cursor.fetchall()]
+        table_columns = cursor.fetchall()
+
+        counts = self._dbstat_row_counts() if approximate else {}
 
         tables = []
-        for name in table_names:
+        for name, col_count in table_columns:
             # Row count
-            try:
-                cursor.execute('SELECT COUNT(*) FROM "%s"' % name)
-                row_count = cursor.fetchone()[0]
-            except sqlite3.OperationalError:
-                row_count = -1
-
-            # Column count
-            cursor.execute('PRAGMA table_info("%s")' % name)
-            columns = cursor.fetchall()
-            col_count = len(columns)
+            row_count = counts.get(name)
+            if row_count is None:
+                try:
+                    cursor.execute('SELECT COUNT(*) FROM "%s"' % name)
+                    row_count = cursor.fetchone()[0]
+                except sqlite3.OperationalError:
+                    row_count = -1
 
             tables.append({
                 "name": name,
@@ -441,6 +925,56 @@ class SQLiteExplorer:
 
         return tables
 
+    def _dbstat_row_counts(self) -> Dict[str, int]:
+        """
+        Get per-table leaf cell counts from the dbstat virtual table.
+
+        Returns:
+            Dict of table name to row count; empty if dbstat is unavailable.
+        """
+        try:
+            cursor = self._connect().execute(
+                "SELECT name, SUM(ncell) FROM dbstat "
+                "WHERE pagetype='leaf' GROUP BY name"
+            )
+        except sqlite3.OperationalError:
+            return {}
+        return {name: count for name, count in cursor.fetchall()}
+
+    def _dbstat_table_bytes(self) -> Dict[str, int]:
+        """
+        Read per-table on-disk sizes from the dbstat virtual table.
+
+        Sums the data and overflow pages of each table's own b-tree; index
+        b-trees are not included.
+
+        Returns:
+            Dict of table name to bytes; empty if dbstat is unavailable.
+        """
+        try:
+            cursor = self._connect().execute(
+                "SELECT name, SUM(pgsize) FROM dbstat GROUP BY name"
+            )
+        except sqlite3.OperationalError:
+            return {}
+        return {name: size for name, size in cursor.fetchall()}
+
+    @staticmethod
+    def _sample_table_bytes(cursor: sqlite3.Cursor, table: str,
+                            row_count: int) -> int:
+        """
+        Estimate a table's data size from its first row.
+
+        Returns:
+            Length of the first row's values as text times row_count.
+        """
+        cursor.execute('SELECT * FROM "%s" LIMIT 1' % table)
+        sample = cursor.fetchone()
+        if not sample or row_count <= 0:
+            return 0
+        row_size = sum(len(str(v)) if v is not None else 0 for v in sample)
+        return row_size * row_count
+
     # -------------------------------------------------------------------------
     # SCHEMA
     # -------------------------------------------------------------------------
@@ -458,81 +992,90 @@ class SQLiteExplorer:
         Raises:
             ValueError: If the specified table does not exist.
         """
+        return deepcopy(self._cached(("schema", table),
+                                     lambda: self._load_schema(table)))
+
+    def _load_schema(self, table: Optional[str]) -> List[Dict[str, Any]]:
+        """Query column, index and foreign key metadata for get_schema()."""
         conn = self._connect()
         cursor = conn.cursor()
 
         if table:
-            # Verify table exists
-            cursor.execute(
-                "SELECT name FROM sqlite_master WHERE type='table' AND name=?",
-                (table,)
-            )
-            if not cursor.fetchone():
-                available = [t["name"] for t in self.get_tables()]
-                raise ValueError(
-                    "Table '%s' not found. Available tables: %s"
-                    % (table, ", ".join(available) if available else "(none)")
-                )
-            table_names = [table]
+            scope = "m.type='table' AND m.name=?"
+            params = (table,)
         else:
-            cursor.execute(
-                "SELECT name FROM sqlite_master WHERE type='table' "
-                "AND name NOT LIKE 'sqlite_%' ORDER BY name"
+            scope = "m.type='table' AND m.name NOT LIKE 'sqlite_%'"
+            params = ()
+
+        # One statement per kind of metadata, joined against sqlite_master,
+        # instead of a round of PRAGMAs per table and per index.
+        cursor.execute(
+            "SELECT m.name, m.sql FROM sqlite_master m WHERE %s "
+            "ORDER BY m.name" % scope, params
+        )
+        tables = cursor.fetchall()
+        if table and not tables:
+            available = self._user_tables()
+            raise ValueError(
+                "Table '%s' not found. Available tables: %s"
+                % (table, ", ".join(available) if available else "(none)")
             )
-            table_names = [row[0] for row in cursor.fetchall()]
 
-        schemas = []
-        for tbl in table_names:
-            # Column info
-            cursor.execute('PRAGMA table_info("%s")' % tbl)
-            columns = []
-            for col in cursor.fetchall():
-                columns.append({
-                    "cid": col[0],
-                    "name": col[1],
-                    "type": col[2] if col[2] else "ANY",
-                    "notnull": bool(col[3]),
-                    "default": col[4],
-                    "pk": bool(col[5]),
-                })
+        columns = defaultdict(list)
+        cursor.execute(
+            'SELECT m.name, c.cid, c.name, c.type, c."notnull", '
+            "c.dflt_value, c.pk FROM sqlite_master m, "
+            "pragma_table_info(m.name) c WHERE %s "
+            "ORDER BY m.name, c.cid" % scope, params
+        )
+        for row in cursor.fetchall():
+            columns[row[0]].append({
+                "cid": row[1],
+                "name": row[2],
+                "type": row[3] if row[3] else "ANY",
+                "notnull": bool(row[4]),
+                "default": row[5],
+                "pk": bool(row[6]),
+            })
 
-            # Indexes
-            cursor.execute('PRAGMA index_list("%s")' % tbl)
-            indexes = []
-            for idx in cursor.fetchall():
-                idx_name = idx[1]
-                idx_unique = bool(idx[2])
-                cursor.execute('PRAGMA index_info("%s")' % idx_name)
-                idx_columns = [ic[2] for ic in cursor.fetchall()]
-                indexes.append({
+        indexes = defaultdict(list)
+        cursor.execute(
+            "SELECT m.name, il.name, il.\"unique\", ii.name "
+            "FROM sqlite_master m, pragma_index_list(m.name) il "
+            "LEFT JOIN pragma_index_info(il.name) ii WHERE %s "
+            "ORDER BY m.name, il.seq, ii.seqno" % scope, params
+        )
+        for tbl, idx_name, idx_unique, col_name in cursor.fetchall():
+            tbl_indexes = indexes[tbl]
+            if not tbl_indexes or tbl_indexes[-1]["name"] != idx_name:
+                tbl_indexes.append({
                     "name": idx_name,
-                    "unique": idx_unique,
-                    "columns": idx_columns,
+                    "unique": bool(idx_unique),
+                    "columns": [],
                 })
+            tbl_indexes[-1]["columns"].append(col_name)
 
-            # Foreign keys
-            cursor.execute('PRAGMA foreign_key_list("%s")' % tbl)
-            fks = []
-            for fk in cursor.fetchall():
-                fks.append({
-                    "id": fk[0],
-                    "table": fk[2],
-                    "from": fk[3],
-                    "to": fk[4],
-                })
-
-            # CREATE statement
-            cursor.execute(
-                "SELECT sql FROM sqlite_master WHERE type='table' AND name=?",
-                (tbl,)
-            )
-            create_sql = cursor.fetchone()[0]
+        fks = defaultdict(list)
+        cursor.execute(
+            'SELECT m.name, f.id, f."table", f."from", f."to" '
+            "FROM sqlite_master m, pragma_foreign_key_list(m.name) f "
+            "WHERE %s ORDER BY m.name, f.id, f.seq" % scope, params
+        )
+        for row in cursor.fetchall():
+            fks[row[0]].append({
+                "id": row[1],
+                "table": row[2],
+                "from": row[3],
+                "to": row[4],
+            })
 
+        schemas = []
+        for tbl, create_sql in tables:
             schemas.append({
                 "table": tbl,
-                "columns": columns,
-                "indexes": indexes,
-                "foreign_keys": fks,
+                "columns": columns[tbl],
+                "indexes": indexes[tbl],
+                "foreign_keys": fks[tbl],
                 "create_sql": create_sql,
             })
 
@@ -549,6 +1092,7 @@ class SQLiteExplorer:
         offset: int = 0,
         where: str = None,
         order_by: str = None,
+        after_rowid: int = None,
     ) -> Dict[str, Any]:
         """
         Browse table data with pagination.
@@ -559,27 +1103,28 @@ class SQLiteExplorer:
             offset: Starting row offset.
             where: Optional WHERE clause (without WHERE keyword).
             order_by: Optional ORDER BY clause (without ORDER BY keyword).
+            after_rowid: If given, page by rowid instead of offset: return
+                rows with rowid greater than this, in rowid order. Pass the
+                previous page's next_cursor to continue. Each page costs
+                the same however deep it is, unlike OFFSET, which reads
+                and discards every skipped row.
 
         Returns:
-            Dict with headers, rows, total_rows, limit, offset.
+            Dict with headers, rows, total_rows, limit, offset, and
+            next_cursor (last rowid of the page when paging by rowid).
 
         Raises:
-            ValueError: If table does not exist.
+            ValueError: If table does not exist, or if after_rowid is
+                combined with order_by.
         """
+        if after_rowid is not None and order_by:
+            raise ValueError("after_rowid pages in rowid order; "
+                             "it cannot be combined with order_by")
+
         conn = self._connect()
         cursor = conn.cursor()
 
-        # Verify table exists
-        cursor.execute(
-            "SELECT name FROM sqlite_master WHERE type='table' AND name=?",
-            (table,)
-        )
-        if not cursor.fetchone():
-            available = [t["name"] for t in self.get_tables()]
-            raise ValueError(
-                "Table '%s' not found. Available tables: %s"
-                % (table, ", ".join(available) if available else "(none)")
-            )
+        self._require_table(cursor, table)
 
         # Total row count
         count_sql = 'SELECT COUNT(*) FROM "%s"' % table
@@ -589,9 +1134,33 @@ class SQLiteExplorer:
         total_rows = cursor.fetchone()[0]
 
         # Get column names
-        cursor.execute('PRAGMA table_info("%s")' % table)
+        cursor.execute(_TABLE_INFO_SQL, (table,))
         headers = [col[1] for col in cursor.fetchall()]
 
+        if after_rowid is not None:
+            # Keyset pagination: seek straight to the rowid
+            query_sql = 'SELECT rowid, * FROM "%s" WHERE rowid > ?' % table
+            if where:
+                query_sql += " AND (%s)" % where
+            query_sql += " ORDER BY rowid LIMIT %d" % limit
+            cursor.execute(query_sql, (after_rowid,))
+            keyed = cursor.fetchall()
+            rows = [list(row[1:]) for row in keyed]
+            next_cursor = keyed[-1][0] if keyed else None
+            return {
+                "table": table,
+                "headers": headers,
+                "rows": rows,
+                "total_rows": total_rows,
+                "limit": limit,
+                "offset": None,
+                "after_rowid": after_rowid,
+                "next_cursor": next_cursor,
+                "showing": "%d rows after rowid %d of %d" % (
+                    len(rows), after_rowid, total_rows,
+                ),
+            }
+
         # Build query
         query_sql = 'SELECT * FROM "%s"' % table
         if where:
@@ -610,6 +1179,8 @@ class SQLiteExplorer:
             "total_rows": total_rows,
             "limit": limit,
             "offset": offset,
+            "after_rowid": None,
+            "next_cursor": None,
             "showing": "%d-%d of %d" % (
                 offset + 1 if rows else 0,
                 offset + len(rows),
@@ -653,6 +1224,47 @@ class SQLiteExplorer:
             "row_count": len(rows),
         }
 
+    def query_columns(self, sql: str) -> Dict[str, Any]:
+        """
+        Execute a query and return its results column by column.
+
+        Columns holding only integers come back as array('q') and columns
+        of integers and floats as array('d'): 8 bytes per value instead of
+        a Python object each, ready for sum()/min()/statistics. Any other
+        column (text, BLOBs, NULLs) is a plain list. Rows are fetched in
+        batches, so no row-oriented copy of the result is ever built.
+
+        Args:
+            sql: SQL query string.
+
+        Returns:
+            Dict with headers, columns (one sequence per header),
+            row_count, and the executed sql.
+
+        Raises:
+            sqlite3.Error: On SQL errors.
+        """
+        cursor = self._connect().cursor()
+        cursor.execute(sql)
+
+        headers = [desc[0] for desc in cursor.description or ()]
+        columns = [array("q") for _ in headers]
+        row_count = 0
+        while headers:
+            rows = cursor.fetchmany(_COLUMN_BATCH_ROWS)
+            if not rows:
+                break
+            row_count += len(rows)
+            for i, values in enumerate(zip(*rows)):
+                columns[i] = _extend_column(columns[i], values)
+
+        return {
+            "sql": sql,
+            "headers": headers,
+            "columns": columns,
+            "row_count": row_count,
+        }
+
     # -------------------------------------------------------------------------
     # EXPORT
     # -------------------------------------------------------------------------
@@ -669,62 +1281,67 @@ class SQLiteExplorer:
 
         Args:
             table: Table name to export (ignored if query_sql provided).
-            fmt: Output format ('csv', 'json', 'md').
-            output: Output file path, or None for stdout.
+            fmt: Output format ('csv', 'json', 'jsonl', 'md').
+            output: Output file path, or None to return the data.
             query_sql: Optional SQL query to export instead of full table.
 
         Returns:
-            Formatted string of the export data.
+            Formatted string of the export data. When output is given the
+            rows are streamed straight to the file and "" is returned.
         """
-        if query_sql:
-            result = self.query(query_sql)
-            headers = result["headers"]
-            rows = result["rows"]
-        else:
-            # Verify table exists
-            conn = self._connect()
-            cursor = conn.cursor()
-            cursor.execute(
-                "SELECT name FROM sqlite_master WHERE type='table' AND name=?",
-                (table,)
-            )
-            if not cursor.fetchone():
-                available = [t["name"] for t in self.get_tables()]
-                raise ValueError(
-                    "Table '%s' not found. Available tables: %s"
-                    % (table, ", ".join(available) if available else "(none)")
-                )
-
-            cursor.execute('PRAGMA table_info("%s")' % table)
-            headers = [col[1] for col in cursor.fetchall()]
-
-            cursor.execute('SELECT * FROM "%s"' % table)
-            rows = [list(row) for row in cursor.fetchall()]
-
-        # Format
-        if fmt == "json":
-            data = []
-            for row in rows:
-                record = {}
-                for i, h in enumerate(headers):
-                    val = row[i] if i < len(row) else None
-                    if isinstance(val, bytes):
-                        val = "<BLOB %d bytes>" % len(val)
-                    record[h] = val
-                data.append(record)
-            content = TableFormatter.format_json(data)
-        elif fmt == "md":
-            content = TableFormatter.format_markdown(headers, rows)
-        else:  # csv
-            content = TableFormatter.format_csv_str(headers, rows)
-
-        # Write to file or return
         if output:
+            # Validate and run the query before touching the file, so a bad
+            # table or query leaves an existing output file intact
+            headers, rows = self._export_rows(table, query_sql)
             output_path = Path(output)
             output_path.parent.mkdir(parents=True, exist_ok=True)
-            output_path.write_text(content, encoding="utf-8")
+            with open(output_path, "w", encoding="utf-8", newline="",
+                      buffering=_EXPORT_BUFFER_SIZE) as fp:
+                _write_export(fp, headers, rows, fmt)
+            return ""
 
-        return content
+        buffer = io.StringIO()
+        self.export_to(buffer, table, fmt, query_sql)
+        return buffer.getvalue()
+
+    def export_to(
+        self,
+        fp: TextIO,
+        table: str,
+        fmt: str = "csv",
+        query_sql: str = None,
+    ) -> None:
+        """
+        Stream table or query results to a text stream.
+
+        Rows go from the cursor to fp one at a time, so memory use does not
+        grow with the size of the export.
+
+        Args:
+            fp: Writable text stream (files should be opened with newline="").
+            table: Table name to export (ignored if query_sql provided).
+            fmt: Output format ('csv', 'json', 'jsonl', 'md').
+            query_sql: Optional SQL query to export instead of full table.
+
+        Raises:
+            ValueError: If the table does not exist.
+        """
+        headers, rows = self._export_rows(table, query_sql)
+        _write_export(fp, headers, rows, fmt)
+
+    def _export_rows(self, table: str, query_sql: str = None) -> Tuple:
+        """Run the export query; return (headers, iterable of row tuples)."""
+        conn = self._connect()
+        cursor = conn.cursor()
+
+        if query_sql:
+            cursor.execute(query_sql)
+        else:
+            self._require_table(cursor, table)
+            cursor.execute('SELECT * FROM "%s"' % table)
+
+        headers = [desc[0] for desc in cursor.description or ()]
+        return headers, (cursor if cursor.description else ())
 
     # -------------------------------------------------------------------------
     # STATS
@@ -746,75 +1363,49 @@ class SQLiteExplorer:
         conn = self._connect()
         cursor = conn.cursor()
 
-        # Verify table exists
-        cursor.execute(
-            "SELECT name FROM sqlite_master WHERE type='table' AND name=?",
-            (table,)
-        )
-        if not cursor.fetchone():
-            available = [t["name"] for t in self.get_tables()]
-            raise ValueError(
-                "Table '%s' not found. Available tables: %s"
-                % (table, ", ".join(available) if available else "(none)")
-            )
+        self._require_table(cursor, table)
 
         # Get columns
-        cursor.execute('PRAGMA table_info("%s")' % table)
+        cursor.execute(_TABLE_INFO_SQL, (table,))
         columns_info = cursor.fetchall()
 
-        # Total rows
-        cursor.execute('SELECT COUNT(*) FROM "%s"' % table)
-        total_rows = cursor.fetchone()[0]
+        # All aggregates for a batch of columns in a single table scan;
+        # only very wide tables need more than one batch
+        col_names = [col_info[1] for col_info in columns_info]
+        total_rows = 0
+        values = []
+        for start in range(0, len(col_names), _STATS_BATCH_COLUMNS):
+            batch = col_names[start:start + _STATS_BATCH_COLUMNS]
+            try:
+                cursor.execute(_stats_sql(table, batch))
+            except sqlite3.OperationalError:
+                # SUM() raises on integer overflow; drop the sums rather than
+                # losing every other statistic with them.
+                cursor.execute(_stats_sql(table, batch, with_sum=False))
+            row = cursor.fetchone()
+            total_rows = row[0]
+            values.extend(row[1:])
 
         stats = []
-        for col_info in columns_info:
-            col_name = col_info[1]
-            col_type = col_info[2] if col_info[2] else "ANY"
-
-            # Basic stats via SQL
-            cursor.execute('''
-                SELECT
-                    COUNT("%s") as non_null,
-                    COUNT(DISTINCT "%s") as distinct_count
-                FROM "%s"
-            ''' % (col_name, col_name, table))
-            row = cursor.fetchone()
-            non_null = row[0]
-            distinct_count = row[1]
+        width = len(_STATS_AGGREGATES)
+        for i, col_info in enumerate(columns_info):
+            non_null, distinct_count, col_min, col_max, col_avg, col_sum = (
+                values[i * width:(i + 1) * width]
+            )
             null_count = total_rows - non_null
-
-            stat = {
-                "column": col_name,
-                "type": col_type,
+            stats.append({
+                "column": col_info[1],
+                "type": col_info[2] if col_info[2] else "ANY",
                 "total_rows": total_rows,
                 "non_null": non_null,
                 "null_count": null_count,
                 "null_pct": ("%.1f%%" % (null_count / total_rows * 100)) if total_rows > 0 else "N/A",
                 "distinct": distinct_count,
-            }
-
-            # Numeric stats (try, may fail for non-numeric)
-            try:
-                cursor.execute('''
-                    SELECT
-                        MIN("%s"),
-                        MAX("%s"),
-                        AVG("%s"),
-                        SUM("%s")
-                    FROM "%s"
-                ''' % (col_name, col_name, col_name, col_name, table))
-                num_row = cursor.fetchone()
-                stat["min"] = num_row[0]
-                stat["max"] = num_row[1]
-                stat["avg"] = round(num_row[2], 4) if num_row[2] is not None else None
-                stat["sum"] = num_row[3]
-            except (sqlite3.OperationalError, TypeError):
-                stat["min"] = None
-                stat["max"] = None
-                stat["avg"] = None
-                stat["sum"] = None
-
-            stats.append(stat)
+                "min": col_min,
+                "max": col_max,
+                "avg": round(col_avg, 4) if col_avg is not None else None,
+                "sum": col_sum,
+            })
 
         return stats
 
@@ -827,14 +1418,19 @@ class SQLiteExplorer:
         term: str,
         tables: List[str] = None,
         limit: int = 100,
+        use_fts: bool = False,
     ) -> List[Dict[str, Any]]:
         """
         Search for a term across all text columns in all tables.
 
         Args:
-            term: Search term (case-insensitive LIKE match).
+            term: Search term (case-insensitive substring match).
             tables: Optional list of table names to search. None = all tables.
             limit: Maximum total results.
+            use_fts: If True, answer from a temporary FTS5 trigram index
+                built on first use and rebuilt after the database changes.
+                Terms shorter than 3 characters, and tables that cannot be
+                indexed, are still scanned.
 
         Returns:
             List of match dicts with table, column, row data.
@@ -845,8 +1441,15 @@ class SQLiteExplorer:
         if tables:
             search_tables = tables
         else:
-            search_tables = [t["name"] for t in self.get_tables()]
+            # Names only: get_tables() would COUNT(*) every table first,
+            # even when the limit is reached in the first one searched
+            search_tables = self._user_tables()
 
+        indexed = set()
+        if use_fts and len(term) >= 3:
+            indexed = self._search_index(cursor)
+
+        table_columns = self._text_columns()
         matches = []
         remaining = limit
 
@@ -854,64 +1457,210 @@ class SQLiteExplorer:
             if remaining <= 0:
                 break
 
-            # Get text-like columns
-            cursor.execute('PRAGMA table_info("%s")' % tbl)
-            columns = cursor.fetchall()
-            text_cols = []
-            all_col_names = []
-            for col in columns:
-                all_col_names.append(col[1])
-                col_type = (col[2] or "").upper()
-                if col_type in ("", "TEXT", "VARCHAR", "CHAR", "CLOB",
-                                "ANY", "STRING", "NVARCHAR"):
-                    text_cols.append(col[1])
-                elif not col_type.startswith(("INT", "REAL", "FLOAT",
-                                              "DOUBLE", "NUMERIC", "BLOB",
-                                              "BOOLEAN")):
-                    # Include columns with unknown types
-                    text_cols.append(col[1])
-
+            columns = table_columns.get(tbl)
+            if columns is None:
+                # Not a table: a view named in tables=, or no such object
+                columns = self._object_text_columns(tbl)
+            all_col_names, text_cols = columns
             if not text_cols:
                 continue
 
-            # Build search query
-            conditions = ' OR '.join(
-                '"%s" LIKE ?' % col for col in text_cols
-            )
-            sql = 'SELECT * FROM "%s" WHERE %s LIMIT %d' % (
-                tbl, conditions, remaining
-            )
-            params = ["%%%s%%" % term] * len(text_cols)
-
             try:
-                cursor.execute(sql, params)
-                rows = cursor.fetchall()
-                for row in rows:
-                    # Find which column(s) matched
-                    matched_cols = []
-                    for col in text_cols:
-                        idx = all_col_names.index(col)
-                        val = row[idx]
-                        if val is not None and term.lower() in str(val).lower():
-                            matched_cols.append(col)
-
-                    match_data = {}
-                    for i, col_name in enumerate(all_col_names):
-                        match_data[col_name] = row[i]
-
-                    matches.append({
-                        "table": tbl,
-                        "matched_columns": matched_cols,
-                        "data": match_data,
-                    })
-                    remaining -= 1
-                    if remaining <= 0:
-                        break
+                if tbl in indexed:
+                    rows = self._search_fts(cursor, tbl, text_cols, term,
+                                            remaining)
+                else:
+                    rows = self._search_scan(cursor, tbl, text_cols, term,
+                                             remaining)
             except sqlite3.OperationalError:
                 continue
 
+            for row, matched_cols in rows:
+                matches.append({
+                    "table": tbl,
+                    "matched_columns": matched_cols,
+                    "data": dict(zip(all_col_names, row)),
+                })
+            remaining -= len(rows)
+
         return matches
 
+    def _user_tables(self) -> List[str]:
+        """
+        Names of all non-internal tables, sorted, without counting rows.
+
+        Returns:
+            The table names get_tables() would list, memoized until the
+            schema changes.
+        """
+        return self._cached(("user_tables",), lambda: [
+            name for name, is_user
+            in self._connect().execute(_TABLE_NAMES_SQL) if is_user
+        ])
+
+    def _text_columns(self) -> Dict[str, Tuple[List[str], List[str]]]:
+        """
+        Split every table's columns into all names and searchable text names.
+
+        Read with one set-based query (the type test runs in SQL) and
+        memoized until the schema changes.
+
+        Returns:
+            Dict of table name to (all column names, text-like column
+            names), each in table order.
+        """
+        def load():
+            columns = defaultdict(lambda: ([], []))
+            for tbl, col, is_text in self._connect().execute(_TEXT_COLUMNS_SQL):
+                all_col_names, text_cols = columns[tbl]
+                all_col_names.append(col)
+                if is_text:
+                    text_cols.append(col)
+            return dict(columns)
+
+        return self._cached(("text_columns",), load)
+
+    def _object_text_columns(self, name: str) -> Tuple[List[str], List[str]]:
+        """
+        Split one table or view's columns like _text_columns() does.
+
+        Returns:
+            (all column names, text-like column names); both empty if the
+            object does not exist or cannot be read.
+        """
+        def load():
+            all_col_names, text_cols = [], []
+            try:
+                rows = self._connect().execute(
+                    _OBJECT_TEXT_COLUMNS_SQL, (name,)
+                ).fetchall()
+            except sqlite3.OperationalError:
+                rows = []
+            for col, is_text in rows:
+                all_col_names.append(col)
+                if is_text:
+                    text_cols.append(col)
+            return all_col_names, text_cols
+
+        return self._cached(("text_columns", name), load)
+
+    @staticmethod
+    def _search_scan(cursor: sqlite3.Cursor, table: str,
+                     text_cols: List[str], term: str,
+                     limit: int) -> List[Tuple[tuple, List[str]]]:
+        """
+        Scan a table for rows containing the term.
+
+        One instr() flag per text column is selected after the row, so the
+        matched columns come back with the data instead of being
+        re-checked in Python.
+
+        Returns:
+            List of (row values, matched column names).
+        """
+        tests = ['instr(lower("%s"), lower(?1)) > 0' % col
+                 for col in text_cols]
+        cursor.execute(
+            'SELECT *, %s FROM "%s" WHERE %s LIMIT %d'
+            % (", ".join(tests), table, " OR ".join(tests), limit),
+            (term,)
+        )
+        split = -len(text_cols)
+        return [
+            (row[:split],
+             [col for col, hit in zip(text_cols, row[split:]) if hit])
+            for row in cursor.fetchall()
+        ]
+
+    @staticmethod
+    def _search_fts(cursor: sqlite3.Cursor, table: str,
+                    text_cols: List[str], term: str,
+                    limit: int) -> List[Tuple[tuple, List[str]]]:
+        """
+        Look up rows containing the term in the temporary FTS5 index.
+
+        Returns:
+            List of (row values, matched column names).
+        """
+        cursor.execute(
+            'SELECT t.*, m.cols FROM ('
+            "SELECT rid, group_concat(col, char(31)) AS cols "
+            "FROM temp.search_idx WHERE value MATCH ? AND tbl = ? "
+            "GROUP BY rid ORDER BY rid LIMIT %d"
+            ') m JOIN "%s" t ON t.rowid = m.rid ORDER BY m.rid'
+            % (limit, table),
+            ('"%s"' % term.replace('"', '""'), table)
+        )
+        results = []
+        for row in cursor.fetchall():
+            hits = set(row[-1].split("\x1f"))
+            results.append(
+                (row[:-1], [col for col in text_cols if col in hits])
+            )
+        return results
+
+    def _search_index(self, cursor: sqlite3.Cursor) -> set:
+        """
+        Build the temporary FTS5 search index, or reuse the current one.
+
+        The index is memoized with _cached, so it is rebuilt on the next
+        search after the schema changes or another connection commits.
+
+        Returns:
+            Set of table names present in the index. Empty when FTS5 or
+            the trigram tokenizer is unavailable.
+        """
+        return self._cached(("search_index",),
+                            lambda: self._load_search_index(cursor))
+
+    def _load_search_index(self, cursor: sqlite3.Cursor) -> set:
+        """
+        (Re)build temp.search_idx from the current database contents.
+
+        Every non-NULL value of every text column is inserted with its
+        table, column and rowid. The trigram tokenizer keeps MATCH a
+        case-insensitive substring test.
+        """
+        indexed = set()
+        conn = cursor.connection
+        # query_only also blocks writes to the temp schema
+        query_only = conn.execute("PRAGMA query_only").fetchone()[0]
+        conn.execute("PRAGMA query_only=0")
+        try:
+            cursor.execute("DROP TABLE IF EXISTS temp.search_idx")
+            try:
+                cursor.execute(
+                    "CREATE VIRTUAL TABLE temp.search_idx USING fts5("
+                    "tbl UNINDEXED, col UNINDEXED, rid UNINDEXED, value, "
+                    "tokenize='trigram')"
+                )
+            except sqlite3.OperationalError:
+                return indexed
+
+            table_columns = self._text_columns()
+            for tbl in self._user_tables():
+                text_cols = table_columns.get(tbl, ([], []))[1]
+                try:
+                    for col in text_cols:
+                        cursor.execute(
+                            "INSERT INTO temp.search_idx "
+                            '(tbl, col, rid, value) SELECT ?, ?, rowid, "%s" '
+                            'FROM "%s" WHERE "%s" IS NOT NULL'
+                            % (col, tbl, col),
+                            (tbl, col)
+                        )
+                except sqlite3.OperationalError:
+                    # WITHOUT ROWID tables have no rowid to point back to
+                    cursor.execute(
+                        "DELETE FROM temp.search_idx WHERE tbl = ?", (tbl,)
+                    )
+                    continue
+                indexed.add(tbl)
+            conn.commit()
+        finally:
+            conn.execute("PRAGMA query_only=%d" % query_only)
+        return indexed
+
     # -------------------------------------------------------------------------
     # SIZE
     # -------------------------------------------------------------------------
@@ -923,6 +1672,10 @@ class SQLiteExplorer:
         Returns:
             Dict with file size, table sizes, index sizes, free space.
         """
+        return deepcopy(self._cached(("size",), self._load_size))
+
+    def _load_size(self) -> Dict[str, Any]:
+        """Compute page usage and per-table sizes for get_size()."""
         conn = self._connect()
         cursor = conn.cursor()
 
@@ -939,45 +1692,31 @@ class SQLiteExplorer:
         free_space = freelist_count * page_size
         used_space = used_pages * page_size
 
-        # Table sizes (approximate via row count * avg row size)
+        # Table sizes: exact on-disk bytes from dbstat where available,
+        # otherwise estimated from the first row times the row count
+        page_bytes = self._dbstat_table_bytes()
         table_sizes = []
         tables = self.get_tables()
         for tbl in tables:
             tbl_name = tbl["name"]
             try:
-                # Get approximate size by counting pages used
-                cursor.execute(
-                    'SELECT SUM(LENGTH(CAST("%s" AS TEXT))) FROM (SELECT * FROM "%s")'
-                    % (tbl_name, tbl_name)
-                )
-                # Simpler approach: estimate from data length
-                cursor.execute('SELECT * FROM "%s" LIMIT 1' % tbl_name)
-                sample = cursor.fetchone()
-                if sample and tbl["row_count"] > 0:
-                    # Estimate avg row size from first row
-                    row_size = sum(
-                        len(str(v)) if v is not None else 0
-                        for v in sample
-                    )
-                    est_size = row_size * tbl["row_count"]
+                if tbl_name in page_bytes:
+                    est_size = page_bytes[tbl_name]
                 else:
-                    est_size = 0
-
-                table_sizes.append({
-                    "table": tbl_name,
-                    "rows": tbl["row_count"],
-                    "columns": tbl["column_count"],
-                    "estimated_data_size": est_size,
-                    "estimated_data_size_display": _format_size(est_size),
-                })
+                    est_size = self._sample_table_bytes(
+                        cursor, tbl_name, tbl["row_count"]
+                    )
+                display = _format_size(est_size)
             except sqlite3.OperationalError:
-                table_sizes.append({
-                    "table": tbl_name,
-                    "rows": tbl["row_count"],
-                    "columns": tbl["column_count"],
-                    "estimated_data_size": 0,
-                    "estimated_data_size_display": "N/A",
-                })
+                est_size = 0
+                display = "N/A"
+            table_sizes.append({
+                "table": tbl_name,
+                "rows": tbl["row_count"],
+                "columns": tbl["column_count"],
+                "estimated_data_size": est_size,
+                "estimated_data_size_display": display,
+            })
 
         return {
             "file_size": file_size,
@@ -1008,78 +1747,120 @@ class SQLiteExplorer:
         Returns:
             Dict with differences (tables only in A, only in B, column diffs).
         """
+        # A file compared with itself can't differ; skip opening it again
+        other_path = Path(other_db_path)
+        if other_path.is_file() and os.path.samefile(other_path, self.db_path):
+            return {
+                "database_a": str(self.db_path),
+                "database_b": str(other_path.resolve()),
+                "identical_schema": True,
+                "tables_only_in_a": [],
+                "tables_only_in_b": [],
+                "common_tables": len(self._user_tables()),
+                "table_differences": [],
+            }
+
+        # Only diff needs a thread pool; concurrent.futures is slow to import
+        from concurrent.futures import ThreadPoolExecutor
+
         other = SQLiteExplorer(other_db_path)
-        try:
-            my_tables = {t["name"]: t for t in self.get_tables()}
-            other_tables = {t["name"]: t for t in other.get_tables()}
-
-            only_in_a = sorted(set(my_tables.keys()) - set(other_tables.keys()))
-            only_in_b = sorted(set(other_tables.keys()) - set(my_tables.keys()))
-            common = sorted(set(my_tables.keys()) & set(other_tables.keys()))
-
-            column_diffs = []
-            for tbl in common:
-                my_schema = self.get_schema(tbl)[0]
-                other_schema = other.get_schema(tbl)[0]
-
-                my_cols = {c["name"]: c for c in my_schema["columns"]}
-                other_cols = {c["name"]: c for c in other_schema["columns"]}
-
-                cols_only_a = sorted(set(my_cols.keys()) - set(other_cols.keys()))
-                cols_only_b = sorted(set(other_cols.keys()) - set(my_cols.keys()))
-
-                type_diffs = []
-                for col in sorted(set(my_cols.keys()) & set(other_cols.keys())):
-                    if my_cols[col]["type"] != other_cols[col]["type"]:
-                        type_diffs.append({
-                            "column": col,
-                            "type_a": my_cols[col]["type"],
-                            "type_b": other_cols[col]["type"],
-                        })
-
-                row_diff = my_tables[tbl]["row_count"] - other_tables[tbl]["row_count"]
-
-                if cols_only_a or cols_only_b or type_diffs or row_diff != 0:
-                    column_diffs.append({
-                        "table": tbl,
-                        "columns_only_in_a": cols_only_a,
-                        "columns_only_in_b": cols_only_b,
-                        "type_differences": type_diffs,
-                        "row_count_a": my_tables[tbl]["row_count"],
-                        "row_count_b": other_tables[tbl]["row_count"],
-                        "row_diff": row_diff,
+
+        def read_other():
+            try:
+                return other._diff_snapshot()
+            finally:
+                other.close()
+
+        # Read both databases at once. The other database is opened, read
+        # and closed entirely on the worker thread, since a sqlite3
+        # connection may only be used by the thread that created it.
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            other_future = pool.submit(read_other)
+            my_tables, my_schemas = self._diff_snapshot()
+            other_tables, other_schemas = other_future.result()
+
+        only_in_a = sorted(set(my_tables.keys()) - set(other_tables.keys()))
+        only_in_b = sorted(set(other_tables.keys()) - set(my_tables.keys()))
+        common = sorted(set(my_tables.keys()) & set(other_tables.keys()))
+
+        column_diffs = []
+        for tbl in common:
+            my_schema = my_schemas[tbl]
+            other_schema = other_schemas[tbl]
+
+            my_cols = {c["name"]: c for c in my_schema["columns"]}
+            other_cols = {c["name"]: c for c in other_schema["columns"]}
+
+            cols_only_a = sorted(set(my_cols.keys()) - set(other_cols.keys()))
+            cols_only_b = sorted(set(other_cols.keys()) - set(my_cols.keys()))
+
+            type_diffs = []
+            for col in sorted(set(my_cols.keys()) & set(other_cols.keys())):
+                if my_cols[col]["type"] != other_cols[col]["type"]:
+                    type_diffs.append({
+                        "column": col,
+                        "type_a": my_cols[col]["type"],
+                        "type_b": other_cols[col]["type"],
                     })
 
-            identical = (
-                not only_in_a
-                and not only_in_b
-                and not column_diffs
-            )
+            row_diff = my_tables[tbl]["row_count"] - other_tables[tbl]["row_count"]
+
+            if cols_only_a or cols_only_b or type_diffs or row_diff != 0:
+                column_diffs.append({
+                    "table": tbl,
+                    "columns_only_in_a": cols_only_a,
+                    "columns_only_in_b": cols_only_b,
+                    "type_differences": type_diffs,
+                    "row_count_a": my_tables[tbl]["row_count"],
+                    "row_count_b": other_tables[tbl]["row_count"],
+                    "row_diff": row_diff,
+                })
 
-            return {
-                "database_a": str(self.db_path),
-                "database_b": str(other.db_path),
-                "identical_schema": identical,
-                "tables_only_in_a": only_in_a,
-                "tables_only_in_b": only_in_b,
-                "common_tables": len(common),
-                "table_differences": column_diffs,
-            }
-        finally:
-            other.close()
+        identical = (
+            not only_in_a
+            and not only_in_b
+            and not column_diffs
+        )
+
+        return {
+            "database_a": str(self.db_path),
+            "database_b": str(other.db_path),
+            "identical_schema": identical,
+            "tables_only_in_a": only_in_a,
+            "tables_only_in_b": only_in_b,
+            "common_tables": len(common),
+            "table_differences": column_diffs,
+        }
+
+    def _diff_snapshot(self) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Read the tables and schemas diff() compares.
+
+        Returns:
+            (tables by name, schemas by table name).
+        """
+        tables = {t["name"]: t for t in self.get_tables()}
+        schemas = {sc["table"]: sc for sc in self.get_schema()}
+        return tables, schemas
 
     # -------------------------------------------------------------------------
     # VACUUM
     # -------------------------------------------------------------------------
 
-    def vacuum(self) -> Dict[str, Any]:
+    def vacuum(self, into: str = None) -> Dict[str, Any]:
         """
         Optimize the database with VACUUM.
 
         Requires closing the read-only connection and opening a writable one.
 
+        Args:
+            into: If given, write a compacted copy to this new file with
+                VACUUM INTO and leave the database itself untouched. The
+                copy can then be renamed over the original.
+
         Returns:
-            Dict with before/after sizes.
+            Dict with before/after sizes (after = size of the copy when
+            into is given).
         """
         before_size = self.db_path.stat().st_size
 
@@ -1089,11 +1870,15 @@ class SQLiteExplorer:
         # Open writable connection for vacuum
         conn = sqlite3.connect(str(self.db_path))
         try:
-            conn.execute("VACUUM")
+            conn.executescript(_VACUUM_PRAGMAS)
+            if into:
+                conn.execute("VACUUM INTO ?", (str(into),))
+            else:
+                conn.execute("VACUUM")
         finally:
             conn.close()
 
-        after_size = self.db_path.stat().st_size
+        after_size = Path(into or self.db_path).stat().st_size
         saved = before_size - after_size
 
         return {
@@ -1104,6 +1889,7 @@ class SQLiteExplorer:
             "saved": saved,
             "saved_display": _format_size(saved),
             "saved_pct": "%.1f%%" % (saved / before_size * 100) if before_size > 0 else "0.0%",
+            "into": str(into) if into else None,
         }
 
 
@@ -1111,6 +1897,41 @@ class SQLiteExplorer:
 # UTILITY FUNCTIONS
 # =============================================================================
 
+_STDOUT_BUFFER_SIZE = 65536
+
+# The sys.stdout that _buffer_stdout() replaced, once it has run
+_stdout_original = None
+
+
+def _buffer_stdout() -> None:
+    """Route stdout through one large UTF-8 write buffer for the script run.
+
+    Large browse/query/export output then reaches the terminal or pipe in
+    64 KiB writes rather than one write per line. The buffer is a second
+    stream on the same file descriptor, so the original sys.stdout (and
+    sys.__stdout__) stays usable. Only _cli() calls this, and it flushes
+    sys.stdout before exiting; repeat calls do nothing, and
+    streams without a file descriptor (e.g. a StringIO) are left alone.
+    """
+    global _stdout_original
+
+    if _stdout_original is not None:
+        return
+    stream = sys.stdout
+    try:
+        fd = stream.fileno()
+        stream.flush()
+    except (AttributeError, ValueError, io.UnsupportedOperation):
+        return
+    _stdout_original = stream
+    sys.stdout = open(fd, "w", buffering=_STDOUT_BUFFER_SIZE,
+                      encoding="utf-8", errors=stream.errors, newline="\n",
+                      closefd=False)
+
+
+_UNITS = ("B", "KB", "MB", "GB", "TB")
+
+
 def _format_size(size_bytes: int) -> str:
     """
     Format byte count as human-readable string.
@@ -1123,72 +1944,103 @@ def _format_size(size_bytes: int) -> str:
     """
     if size_bytes < 0:
         return "N/A"
-    if size_bytes == 0:
-        return "0 B"
-    units = ["B", "KB", "MB", "GB", "TB"]
-    i = 0
-    size = float(size_bytes)
-    while size >= 1024 and i < len(units) - 1:
-        size /= 1024
-        i += 1
-    if i == 0:
+    if size_bytes < 1024:
         return "%d B" % size_bytes
-    return "%.1f %s" % (size, units[i])
+    # Each unit step is 10 bits, so the index comes straight from the width.
+    i = min((int(size_bytes).bit_length() - 1) // 10, len(_UNITS) - 1)
+    return f"{size_bytes / (1 << (10 * i)):.1f} {_UNITS[i]}"
 
 
 # =============================================================================
 # CLI DISPLAY FUNCTIONS
 # =============================================================================
 
+_SEP_EQ = "=" * 60
+_SEP_DASH = "-" * 60
+
+# SQL text longer than this is cut short in the query output title
+_TITLE_SQL_CHARS = 60
+
+# Non-JSON renderers for row results, called as (headers, rows, title,
+# max_width); Markdown has no title or width limit
+_ROW_FORMATTERS = {
+    "md": lambda headers, rows, title, max_width: _fmt_md(headers, rows),
+    "text": lambda headers, rows, title, max_width: _fmt_table(
+        headers, rows, max_width, title),
+}
+
+
+def _stream_json(data: Any, out: TextIO) -> str:
+    """
+    Encode data straight into a text stream instead of building a string.
+
+    Produces the same text as TableFormatter.format_json(data).
+
+    Args:
+        data: Data to serialize.
+        out: Writable text stream.
+
+    Returns:
+        An empty string, so callers can print() it for the trailing newline.
+    """
+    write = out.write
+    for chunk in _json_encoder(2).iterencode(data):
+        write(chunk)
+    return ""
+
+
 def _display_info(db: SQLiteExplorer, fmt: str = "text") -> str:
     """Display database info."""
     info = db.get_info()
 
     if fmt == "json":
-        return TableFormatter.format_json(info)
+        return _fmt_json(info)
 
     lines = []
-    lines.append("=" * 60)
-    lines.append("DATABASE INFO")
-    lines.append("=" * 60)
-    lines.append("  Path:           %s" % info["path"])
-    lines.append("  File Size:      %s (%d bytes)" % (info["file_size_display"], info["file_size"]))
-    lines.append("  Last Modified:  %s" % info["modified"])
-    lines.append("  SQLite Version: %s" % info["sqlite_version"])
-    lines.append("  Encoding:       %s" % info["encoding"])
-    lines.append("  Journal Mode:   %s" % info["journal_mode"])
-    lines.append("  Page Size:      %s" % _format_size(info["page_size"]))
-    lines.append("  Page Count:     %d" % info["page_count"])
-    lines.append("  Free Pages:     %d" % info["freelist_count"])
-    lines.append("-" * 60)
-    lines.append("  Tables:         %d" % info["table_count"])
-    lines.append("  Indexes:        %d" % info["index_count"])
-    lines.append("  Views:          %d" % info["view_count"])
-    lines.append("  Triggers:       %d" % info["trigger_count"])
-    lines.append("=" * 60)
+    append = lines.append
+    append(_SEP_EQ)
+    append("DATABASE INFO")
+    append(_SEP_EQ)
+    append(f"  Path:           {info['path']}")
+    append(f"  File Size:      {info['file_size_display']} ({info['file_size']} bytes)")
+    append(f"  Last Modified:  {info['modified']}")
+    append(f"  SQLite Version: {info['sqlite_version']}")
+    append(f"  Encoding:       {info['encoding']}")
+    append(f"  Journal Mode:   {info['journal_mode']}")
+    append(f"  Page Size:      {_format_size(info['page_size'])}")
+    append(f"  Page Count:     {info['page_count']}")
+    append(f"  Free Pages:     {info['freelist_count']}")
+    append(_SEP_DASH)
+    append(f"  Tables:         {info['table_count']}")
+    append(f"  Indexes:        {info['index_count']}")
+    append(f"  Views:          {info['view_count']}")
+    append(f"  Triggers:       {info['trigger_count']}")
+    append(_SEP_EQ)
     return "\n".join(lines)
 
 
-def _display_tables(db: SQLiteExplorer, fmt: str = "text") -> str:
+def _display_tables(db: SQLiteExplorer, fmt: str = "text",
+                    approximate: bool = False) -> str:
     """Display table listing."""
-    tables = db.get_tables()
+    tables = db.get_tables(approximate=approximate)
 
     if fmt == "json":
-        return TableFormatter.format_json(tables)
+        return _fmt_json(tables)
 
     if not tables:
         return "(no tables found)"
 
     headers = ["Table Name", "Rows", "Columns"]
-    rows = [[t["name"], t["row_count"], t["column_count"]] for t in tables]
+    rows = [(t["name"], t["row_count"], t["column_count"]) for t in tables]
 
     total_rows = sum(t["row_count"] for t in tables if t["row_count"] >= 0)
-    rows.append(["--- TOTAL ---", total_rows, ""])
+    rows.append(("--- TOTAL ---", total_rows, ""))
 
     if fmt == "md":
-        return TableFormatter.format_markdown(headers, rows)
+        return _format_memoized(_fmt_md, headers, rows)
 
-    return TableFormatter.format_table(headers, rows, title="TABLES")
+    return _format_memoized(_fmt_table, headers, rows,
+                            40, "TABLES")
 
 
 def _display_schema(db: SQLiteExplorer, table: str = None, fmt: str = "text") -> str:
@@ -1196,14 +2048,15 @@ def _display_schema(db: SQLiteExplorer, table: str = None, fmt: str = "text") ->
     schemas = db.get_schema(table)
 
     if fmt == "json":
-        return TableFormatter.format_json(schemas)
+        return _fmt_json(schemas)
 
     parts = []
     for schema in schemas:
         lines = []
-        lines.append("=" * 60)
-        lines.append("TABLE: %s" % schema["table"])
-        lines.append("=" * 60)
+        append = lines.append
+        append(_SEP_EQ)
+        append(f"TABLE: {schema['table']}")
+        append(_SEP_EQ)
 
         # Columns
         col_headers = ["#", "Column", "Type", "NotNull", "Default", "PK"]
@@ -1219,33 +2072,31 @@ def _display_schema(db: SQLiteExplorer, table: str = None, fmt: str = "text") ->
             ])
 
         if fmt == "md":
-            lines.append(TableFormatter.format_markdown(col_headers, col_rows))
+            append(_format_memoized(_fmt_md, col_headers, col_rows))
         else:
-            lines.append(TableFormatter.format_table(col_headers, col_rows))
+            append(_format_memoized(_fmt_table, col_headers, col_rows))
 
         # Indexes
         if schema["indexes"]:
-            lines.append("")
-            lines.append("  Indexes:")
+            append("")
+            append("  Indexes:")
             for idx in schema["indexes"]:
                 unique = " (UNIQUE)" if idx["unique"] else ""
-                lines.append("    - %s%s: %s" % (
-                    idx["name"], unique, ", ".join(idx["columns"])
-                ))
+                append(
+                    f"    - {idx['name']}{unique}: {', '.join(idx['columns'])}"
+                )
 
         # Foreign keys
         if schema["foreign_keys"]:
-            lines.append("")
-            lines.append("  Foreign Keys:")
+            append("")
+            append("  Foreign Keys:")
             for fk in schema["foreign_keys"]:
-                lines.append("    - %s -> %s.%s" % (
-                    fk["from"], fk["table"], fk["to"]
-                ))
+                append(f"    - {fk['from']} -> {fk['table']}.{fk['to']}")
 
         # CREATE SQL
-        lines.append("")
-        lines.append("  CREATE SQL:")
-        lines.append("    %s" % schema["create_sql"])
+        append("")
+        append("  CREATE SQL:")
+        append(f"    {schema['create_sql']}")
 
         parts.append("\n".join(lines))
 
@@ -1253,38 +2104,39 @@ def _display_schema(db: SQLiteExplorer, table: str = None, fmt: str = "text") ->
 
 
 def _display_browse(db: SQLiteExplorer, table: str, limit: int, offset: int,
-                    where: str, order_by: str, fmt: str = "text") -> str:
-    """Display browsed data."""
+                    where: str, order_by: str, fmt: str = "text",
+                    after_rowid: int = None,
+                    out: Optional[TextIO] = None) -> str:
+    """Display browsed data (JSON is written straight to out if given)."""
     result = db.browse(table, limit=limit, offset=offset,
-                       where=where, order_by=order_by)
+                       where=where, order_by=order_by,
+                       after_rowid=after_rowid)
 
     if fmt == "json":
-        return TableFormatter.format_json(result)
-    if fmt == "md":
-        return TableFormatter.format_markdown(result["headers"], result["rows"])
+        if out is not None:
+            return _stream_json(result, out)
+        return _fmt_json(result)
 
-    title = "TABLE: %s  [%s]" % (result["table"], result["showing"])
-    return TableFormatter.format_table(
-        result["headers"], result["rows"], title=title
-    )
+    title = f"TABLE: {result['table']}  [{result['showing']}]"
+    if result["next_cursor"] is not None:
+        title += f"  (next: --after-rowid {result['next_cursor']})"
+    return _ROW_FORMATTERS[fmt](result["headers"], result["rows"], title, 40)
 
 
-def _display_query(db: SQLiteExplorer, sql: str, fmt: str = "text") -> str:
-    """Display query results."""
+def _display_query(db: SQLiteExplorer, sql: str, fmt: str = "text",
+                   out: Optional[TextIO] = None) -> str:
+    """Display query results (JSON is written straight to out if given)."""
     result = db.query(sql)
 
     if fmt == "json":
-        return TableFormatter.format_json(result)
-    if fmt == "md":
-        return TableFormatter.format_markdown(result["headers"], result["rows"])
+        if out is not None:
+            return _stream_json(result, out)
+        return _fmt_json(result)
 
-    title = "QUERY: %s  (%d rows)" % (
-        sql[:60] + ("..." if len(sql) > 60 else ""),
-        result["row_count"],
-    )
-    return TableFormatter.format_table(
-        result["headers"], result["rows"], title=title
-    )
+    title_sql = (sql if len(sql) <= _TITLE_SQL_CHARS
+                 else f"{sql[:_TITLE_SQL_CHARS]}...")
+    title = f"QUERY: {title_sql}  ({result['row_count']} rows)"
+    return _ROW_FORMATTERS[fmt](result["headers"], result["rows"], title, 40)
 
 
 def _display_stats(db: SQLiteExplorer, table: str, fmt: str = "text") -> str:
@@ -1292,68 +2144,72 @@ def _display_stats(db: SQLiteExplorer, table: str, fmt: str = "text") -> str:
     stats = db.get_stats(table)
 
     if fmt == "json":
-        return TableFormatter.format_json(stats)
+        return _fmt_json(stats)
 
     headers = ["Column", "Type", "Non-Null", "Null", "Null%", "Distinct",
                "Min", "Max", "Avg"]
-    rows = []
-    for s in stats:
-        rows.append([
+    # Rows are generated on demand; the formatter keeps only their strings
+    rows = (
+        (
             s["column"],
             s["type"],
             s["non_null"],
             s["null_count"],
             s["null_pct"],
             s["distinct"],
-            s["min"] if s["min"] is not None else "",
-            s["max"] if s["max"] is not None else "",
-            s["avg"] if s["avg"] is not None else "",
-        ])
-
-    if fmt == "md":
-        return TableFormatter.format_markdown(headers, rows)
-
-    return TableFormatter.format_table(
-        headers, rows, title="STATS: %s" % table, max_width=30
+            "" if s["min"] is None else s["min"],
+            "" if s["max"] is None else s["max"],
+            "" if s["avg"] is None else s["avg"],
+        )
+        for s in stats
     )
 
+    return _ROW_FORMATTERS[fmt](headers, rows, f"STATS: {table}", 30)
+
 
 def _display_search(db: SQLiteExplorer, term: str, tables: List[str],
-                    limit: int, fmt: str = "text") -> str:
-    """Display search results."""
-    matches = db.search(term, tables=tables, limit=limit)
+                    limit: int, fmt: str = "text",
+                    use_fts: bool = False,
+                    out: Optional[TextIO] = None) -> str:
+    """Display search results (JSON is written straight to out if given)."""
+    matches = db.search(term, tables=tables, limit=limit, use_fts=use_fts)
 
     if fmt == "json":
-        return TableFormatter.format_json(matches)
+        if out is not None:
+            return _stream_json(matches, out)
+        return _fmt_json(matches)
 
     if not matches:
-        return 'No matches found for "%s"' % term
+        return f'No matches found for "{term}"'
 
     lines = []
-    lines.append("=" * 60)
-    lines.append('SEARCH: "%s"  (%d matches)' % (term, len(matches)))
-    lines.append("=" * 60)
+    append = lines.append
+    append(_SEP_EQ)
+    append(f'SEARCH: "{term}"  ({len(matches)} matches)')
+    append(_SEP_EQ)
 
     for i, match in enumerate(matches, 1):
-        lines.append("")
-        lines.append("--- Match %d [%s] (columns: %s) ---" % (
-            i, match["table"], ", ".join(match["matched_columns"])
-        ))
+        matched = match["matched_columns"]
+        matched_set = frozenset(matched)
+        matched_join = ", ".join(matched)
+        append("")
+        append(f"--- Match {i} [{match['table']}] (columns: {matched_join}) ---")
         for key, val in match["data"].items():
             if val is None:
                 display_val = "NULL"
             elif isinstance(val, bytes):
-                display_val = "<BLOB %d bytes>" % len(val)
+                display_val = f"<BLOB {len(val)} bytes>"
             else:
-                display_val = str(val)
+                display_val = str(val).translate(_NEWLINE_ESCAPES)
                 if len(display_val) > 80:
                     display_val = display_val[:77] + "..."
             # Highlight matched columns
-            marker = " <<" if key in match["matched_columns"] else ""
-            lines.append("  %s: %s%s" % (key, display_val, marker))
+            marker = " <<" if key in matched_set else ""
+            append(f"  {key}: {display_val}{marker}")
 
-    lines.append("")
-    lines.append("(%d match%s)" % (len(matches), "es" if len(matches) != 1 else ""))
+    count = len(matches)
+    append("")
+    append(f"({count} match{'es' if count != 1 else ''})")
     return "\n".join(lines)
 
 
@@ -1362,43 +2218,36 @@ def _display_size(db: SQLiteExplorer, fmt: str = "text") -> str:
     size_info = db.get_size()
 
     if fmt == "json":
-        return TableFormatter.format_json(size_info)
+        return _fmt_json(size_info)
 
     lines = []
-    lines.append("=" * 60)
-    lines.append("SIZE ANALYSIS")
-    lines.append("=" * 60)
-    lines.append("  File Size:   %s" % size_info["file_size_display"])
-    lines.append("  Used Space:  %s (%d pages)" % (
-        size_info["used_space_display"], size_info["used_pages"]
-    ))
-    lines.append("  Free Space:  %s (%d pages, %s)" % (
-        size_info["free_space_display"],
-        size_info["free_pages"],
-        size_info["free_pct"],
-    ))
-    lines.append("  Page Size:   %s" % _format_size(size_info["page_size"]))
-    lines.append("-" * 60)
+    append = lines.append
+    append(_SEP_EQ)
+    append("SIZE ANALYSIS")
+    append(_SEP_EQ)
+    append(f"  File Size:   {size_info['file_size_display']}")
+    append(f"  Used Space:  {size_info['used_space_display']} "
+                 f"({size_info['used_pages']} pages)")
+    append(f"  Free Space:  {size_info['free_space_display']} "
+                 f"({size_info['free_pages']} pages, {size_info['free_pct']})")
+    append(f"  Page Size:   {_format_size(size_info['page_size'])}")
+    append(_SEP_DASH)
 
     if size_info["tables"]:
         headers = ["Table", "Rows", "Columns", "Est. Data Size"]
-        rows = []
-        for t in size_info["tables"]:
-            rows.append([
-                t["table"],
-                t["rows"],
-                t["columns"],
-                t["estimated_data_size_display"],
-            ])
-        lines.append(TableFormatter.format_table(headers, rows, title="TABLE SIZES"))
+        rows = [
+            (t["table"], t["rows"], t["columns"],
+             t["estimated_data_size_display"])
+            for t in size_info["tables"]
+        ]
+        append(_fmt_table(headers, rows, title="TABLE SIZES"))
     else:
-        lines.append("  (no tables)")
+        append("  (no tables)")
 
     if size_info["free_pages"] > 0:
-        lines.append("")
-        lines.append("  [!] %s of free space detected. Run 'vacuum' to reclaim." % (
-            size_info["free_space_display"]
-        ))
+        append("")
+        append(f"  [!] {size_info['free_space_display']} of free space "
+                     "detected. Run 'vacuum' to reclaim.")
 
     return "\n".join(lines)
 
@@ -1408,71 +2257,74 @@ def _display_diff(db: SQLiteExplorer, other_path: str, fmt: str = "text") -> str
     result = db.diff(other_path)
 
     if fmt == "json":
-        return TableFormatter.format_json(result)
+        return _fmt_json(result)
 
     lines = []
-    lines.append("=" * 60)
-    lines.append("SCHEMA DIFF")
-    lines.append("=" * 60)
-    lines.append("  A: %s" % result["database_a"])
-    lines.append("  B: %s" % result["database_b"])
-    lines.append("  Common tables: %d" % result["common_tables"])
-    lines.append("-" * 60)
+    append = lines.append
+    append(_SEP_EQ)
+    append("SCHEMA DIFF")
+    append(_SEP_EQ)
+    append(f"  A: {result['database_a']}")
+    append(f"  B: {result['database_b']}")
+    append(f"  Common tables: {result['common_tables']}")
+    append(_SEP_DASH)
 
     if result["identical_schema"]:
-        lines.append("  [OK] Schemas are identical!")
+        append("  [OK] Schemas are identical!")
         return "\n".join(lines)
 
     if result["tables_only_in_a"]:
-        lines.append("")
-        lines.append("  Tables only in A:")
+        append("")
+        append("  Tables only in A:")
         for t in result["tables_only_in_a"]:
-            lines.append("    + %s" % t)
+            append(f"    + {t}")
 
     if result["tables_only_in_b"]:
-        lines.append("")
-        lines.append("  Tables only in B:")
+        append("")
+        append("  Tables only in B:")
         for t in result["tables_only_in_b"]:
-            lines.append("    + %s" % t)
+            append(f"    + {t}")
 
     if result["table_differences"]:
-        lines.append("")
-        lines.append("  Table Differences:")
+        append("")
+        append("  Table Differences:")
         for diff in result["table_differences"]:
-            lines.append("    Table: %s" % diff["table"])
+            append(f"    Table: {diff['table']}")
             if diff["columns_only_in_a"]:
-                lines.append("      Columns only in A: %s" % ", ".join(diff["columns_only_in_a"]))
+                append(f"      Columns only in A: {', '.join(diff['columns_only_in_a'])}")
             if diff["columns_only_in_b"]:
-                lines.append("      Columns only in B: %s" % ", ".join(diff["columns_only_in_b"]))
+                append(f"      Columns only in B: {', '.join(diff['columns_only_in_b'])}")
             if diff["type_differences"]:
                 for td in diff["type_differences"]:
-                    lines.append("      Column '%s': %s (A) vs %s (B)" % (
-                        td["column"], td["type_a"], td["type_b"]
-                    ))
+                    append(f"      Column '{td['column']}': "
+                                 f"{td['type_a']} (A) vs {td['type_b']} (B)")
             if diff["row_diff"] != 0:
-                lines.append("      Row count: %d (A) vs %d (B) [diff: %+d]" % (
-                    diff["row_count_a"], diff["row_count_b"], diff["row_diff"]
-                ))
+                append(f"      Row count: {diff['row_count_a']} (A) vs "
+                             f"{diff['row_count_b']} (B) [diff: {diff['row_diff']:+d}]")
 
-    lines.append("=" * 60)
+    append(_SEP_EQ)
     return "\n".join(lines)
 
 
-def _display_vacuum(db: SQLiteExplorer, fmt: str = "text") -> str:
+def _display_vacuum(db: SQLiteExplorer, fmt: str = "text",
+                    into: str = None) -> str:
     """Display vacuum results."""
-    result = db.vacuum()
+    result = db.vacuum(into=into)
 
     if fmt == "json":
-        return TableFormatter.format_json(result)
+        return _fmt_json(result)
 
     lines = []
-    lines.append("=" * 60)
-    lines.append("VACUUM COMPLETE")
-    lines.append("=" * 60)
-    lines.append("  Before: %s" % result["before_size_display"])
-    lines.append("  After:  %s" % result["after_size_display"])
-    lines.append("  Saved:  %s (%s)" % (result["saved_display"], result["saved_pct"]))
-    lines.append("=" * 60)
+    append = lines.append
+    append(_SEP_EQ)
+    append("VACUUM COMPLETE")
+    append(_SEP_EQ)
+    append(f"  Before: {result['before_size_display']}")
+    append(f"  After:  {result['after_size_display']}")
+    append(f"  Saved:  {result['saved_display']} ({result['saved_pct']})")
+    if result["into"]:
+        append(f"  Copy:   {result['into']}")
+    append(_SEP_EQ)
     return "\n".join(lines)
 
 
@@ -1480,14 +2332,19 @@ def _display_vacuum(db: SQLiteExplorer, fmt: str = "text") -> str:
 # CLI ENTRY POINT
 # =============================================================================
 
-def main():
-    """CLI entry point for SQLiteExplorer."""
-    # Fix Windows console encoding
-    if sys.platform == "win32":
-        try:
-            sys.stdout.reconfigure(encoding="utf-8")
-        except AttributeError:
-            pass
+@lru_cache(maxsize=None)
+def _build_parser() -> "argparse.ArgumentParser":
+    """
+    Build the CLI argument parser (once per process).
+
+    argparse is imported here rather than at module level, so importing
+    sqliteexplorer for its API doesn't pay for it.
+
+    Returns:
+        The configured ArgumentParser.
+    """
+    import argparse
+    import textwrap
 
     parser = argparse.ArgumentParser(
         prog="sqliteexplorer",
@@ -1513,6 +2370,9 @@ def main():
 
     parser.add_argument("--version", action="version",
                         version="SQLiteExplorer %s" % __version__)
+    parser.add_argument("--immutable", action="store_true",
+                        help="Read without locks or change detection "
+                             "(only for files nothing else is modifying)")
 
     subparsers = parser.add_subparsers(dest="command", help="Command to execute")
 
@@ -1527,6 +2387,8 @@ def main():
     p_tables.add_argument("database", help="Path to SQLite database")
     p_tables.add_argument("--format", choices=["text", "json", "md"],
                           default="text", help="Output format")
+    p_tables.add_argument("--approximate", action="store_true",
+                          help="Fast row counts from page metadata (dbstat)")
 
     # --- schema ---
     p_schema = subparsers.add_parser("schema", help="Show table schema")
@@ -1548,6 +2410,9 @@ def main():
                           help="WHERE clause filter")
     p_browse.add_argument("--order-by", default=None,
                           help="ORDER BY clause")
+    p_browse.add_argument("--after-rowid", type=int, default=None,
+                          help="Page by rowid: rows after this rowid "
+                               "(fast for deep pages)")
     p_browse.add_argument("--format", choices=["text", "json", "md"],
                           default="text", help="Output format")
 
@@ -1562,7 +2427,7 @@ def main():
     p_export = subparsers.add_parser("export", help="Export table data")
     p_export.add_argument("database", help="Path to SQLite database")
     p_export.add_argument("table", help="Table to export")
-    p_export.add_argument("--format", choices=["csv", "json", "md"],
+    p_export.add_argument("--format", choices=["csv", "json", "jsonl", "md"],
                           default="csv", help="Export format (default: csv)")
     p_export.add_argument("--output", "-o", default=None,
                           help="Output file path (default: stdout)")
@@ -1584,6 +2449,8 @@ def main():
                           help="Comma-separated table names to search")
     p_search.add_argument("--limit", type=int, default=100,
                           help="Max results (default: 100)")
+    p_search.add_argument("--fts", action="store_true",
+                          help="Use a temporary FTS5 trigram index")
     p_search.add_argument("--format", choices=["text", "json"],
                           default="text", help="Output format")
 
@@ -1605,9 +2472,86 @@ def main():
     p_vacuum.add_argument("database", help="Path to SQLite database")
     p_vacuum.add_argument("--confirm", action="store_true",
                           help="Required flag to actually vacuum")
+    p_vacuum.add_argument("--into", default=None,
+                          help="Write a compacted copy to this new file "
+                               "(original untouched, no --confirm needed)")
     p_vacuum.add_argument("--format", choices=["text", "json"],
                           default="text", help="Output format")
 
+    return parser
+
+
+def _run_export(db: SQLiteExplorer, args) -> str:
+    """Handle the export command (to a file, or streamed to stdout)."""
+    if args.output:
+        db.export_table(
+            args.table, fmt=args.format,
+            output=args.output, query_sql=args.query
+        )
+        return "[OK] Exported to: %s" % args.output
+    db.export_to(sys.stdout, args.table, fmt=args.format,
+                 query_sql=args.query)
+    return ""
+
+
+def _run_search(db: SQLiteExplorer, args) -> str:
+    """Handle the search command."""
+    search_tables = None
+    if args.tables:
+        search_tables = [t.strip() for t in args.tables.split(",")]
+    return _display_search(db, args.term, search_tables,
+                           args.limit, args.format, args.fts,
+                           out=sys.stdout)
+
+
+def _run_vacuum(db: SQLiteExplorer, args) -> str:
+    """Handle the vacuum command (an in-place vacuum needs --confirm)."""
+    if not args.confirm and not args.into:
+        return ("[!] Vacuum modifies the database file.\n"
+                "    Add --confirm to proceed.\n"
+                "    Recommended: backup your database first.")
+    return _display_vacuum(db, args.format, args.into)
+
+
+# Command name -> handler(db, args) returning the text to print (or None).
+# argparse restricts args.command to these keys.
+_DISPATCH = {
+    "info": lambda db, args: _display_info(db, args.format),
+    "tables": lambda db, args: _display_tables(db, args.format,
+                                               args.approximate),
+    "schema": lambda db, args: _display_schema(db, args.table, args.format),
+    "browse": lambda db, args: _display_browse(
+        db, args.table, args.limit, args.offset,
+        args.where, args.order_by, args.format, args.after_rowid,
+        out=sys.stdout,
+    ),
+    "query": lambda db, args: _display_query(db, args.sql, args.format,
+                                             out=sys.stdout),
+    "export": _run_export,
+    "stats": lambda db, args: _display_stats(db, args.table, args.format),
+    "search": _run_search,
+    "size": lambda db, args: _display_size(db, args.format),
+    "diff": lambda db, args: _display_diff(db, args.other, args.format),
+    "vacuum": _run_vacuum,
+}
+
+# Commands that leave nothing to write back (their explorer may hold the
+# file lock for its whole, short, life).
+_READ_ONLY_COMMANDS = frozenset({
+    "info", "tables", "schema", "browse", "query", "stats", "search",
+    "size", "diff",
+})
+
+
+def main():
+    """
+    Run the CLI and return its exit code.
+
+    Output goes to sys.stdout as it is; the sqliteexplorer command and
+    ``python sqliteexplorer.py`` enter through _cli(), which first makes
+    stdout UTF-8 (fixing the Windows console) and block-buffered.
+    """
+    parser = _build_parser()
     args = parser.parse_args()
 
     if not args.command:
@@ -1615,7 +2559,11 @@ def main():
         return 0
 
     try:
-        db = SQLiteExplorer(args.database)
+        # A one-shot read can keep the file lock for its whole (short) life
+        db = SQLiteExplorer(
+            args.database, immutable=args.immutable,
+            exclusive_lock=args.command in _READ_ONLY_COMMANDS,
+        )
     except FileNotFoundError as e:
         print("[X] Error: %s" % e)
         return 1
@@ -1627,58 +2575,9 @@ def main():
         return 1
 
     try:
-        if args.command == "info":
-            print(_display_info(db, args.format))
-
-        elif args.command == "tables":
-            print(_display_tables(db, args.format))
-
-        elif args.command == "schema":
-            print(_display_schema(db, args.table, args.format))
-
-        elif args.command == "browse":
-            print(_display_browse(
-                db, args.table, args.limit, args.offset,
-                args.where, args.order_by, args.format
-            ))
-
-        elif args.command == "query":
-            print(_display_query(db, args.sql, args.format))
-
-        elif args.command == "export":
-            content = db.export_table(
-                args.table, fmt=args.format,
-                output=args.output, query_sql=args.query
-            )
-            if args.output:
-                print("[OK] Exported to: %s" % args.output)
-            else:
-                print(content)
-
-        elif args.command == "stats":
-            print(_display_stats(db, args.table, args.format))
-
-        elif args.command == "search":
-            search_tables = None
-            if args.tables:
-                search_tables = [t.strip() for t in args.tables.split(",")]
-            print(_display_search(db, args.term, search_tables,
-                                  args.limit, args.format))
-
-        elif args.command == "size":
-            print(_display_size(db, args.format))
-
-        elif args.command == "diff":
-            print(_display_diff(db, args.other, args.format))
-
-        elif args.command == "vacuum":
-            if not args.confirm:
-                print("[!] Vacuum modifies the database file.")
-                print("    Add --confirm to proceed.")
-                print("    Recommended: backup your database first.")
-                return 0
-            print(_display_vacuum(db, args.format))
-
+        result = _DISPATCH[args.command](db, args)
+        if result is not None:
+            print(result)
         return 0
 
     except sqlite3.OperationalError as e:
@@ -1697,5 +2596,16 @@ def main():
         db.close()
 
 
+def _cli():
+    """Console-script entry point: main() with buffered stdout, fast exit."""
+    _buffer_stdout()
+    exit_code = main()
+    # main() has closed the database and any output file; flush the
+    # standard streams and skip interpreter teardown
+    sys.stdout.flush()
+    sys.stderr.flush()
+    os._exit(exit_code)
+
+
 if __name__ == "__main__":
-    sys.exit(main())
+    _cli()
@@ -9,24 +9,114 @@ Tests cover:
 - Integration scenarios (multi-table, large data, various types)
 - Formatters (text, JSON, CSV, Markdown)
 
-Run: python test_sqliteexplorer.py
+Run: python test_sqliteexplorer.py  (add --parallel for one process per class)
+Parallel (with pytest-xdist installed): pytest -n auto test_sqliteexplorer.py
+
+Fixtures are process-local (each worker gets its own scratch directory and
+pid-prefixed file names), so test classes can run in separate processes.
 
 Author: ATLAS (Team Brain)
 Date: February 14, 2026
 """
 
-import json
+import io
 import os
+import re
 import sqlite3
 import sys
 import tempfile
 import unittest
+import unittest.mock
+import uuid
+from contextlib import redirect_stdout
+from datetime import datetime
 from pathlib import Path
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from sqliteexplorer import SQLiteExplorer, TableFormatter, _format_size
+from sqliteexplorer import (SQLiteExplorer, TableFormatter, __version__,
+                            _build_parser, _display_query, _format_memoized,
+                            _format_size, main)
+
+# One scratch directory for the whole module, removed in tearDownModule()
+_TMP = None
+
+# In-memory 1000-row database, built once and cloned by test_large_data
+_LARGE_TEMPLATE = None
+
+# 50-column table for test_many_columns
+_WIDE_COLS = ", ".join("col%d TEXT" % i for i in range(50))
+_WIDE_VALS = ", ".join("'val%d'" % i for i in range(50))
+_WIDE_CREATE = "CREATE TABLE wide (id INTEGER PRIMARY KEY, %s)" % _WIDE_COLS
+_WIDE_INSERT = "INSERT INTO wide VALUES (1, %s)" % _WIDE_VALS
+
+# Banner rule for run_tests()
+_BAR = "=" * 70
+
+
+def setUpModule():
+    """Create the module-wide scratch directory and the large template."""
+    global _TMP, _LARGE_TEMPLATE
+    # Prefer RAM-backed /dev/shm so scratch databases never hit the disk
+    shm = "/dev/shm"
+    ram_dir = shm if os.path.isdir(shm) and os.access(shm, os.W_OK) else None
+    _TMP = tempfile.TemporaryDirectory(dir=ram_dir)
+    _LARGE_TEMPLATE = sqlite3.connect(":memory:", isolation_level=None)
+    _LARGE_TEMPLATE.executescript(
+        "BEGIN; CREATE TABLE data (id INTEGER PRIMARY KEY, value TEXT, num REAL);"
+    )
+    _LARGE_TEMPLATE.executemany(
+        "INSERT INTO data VALUES (?, ?, ?)",
+        ((i, "item_%d" % i, i * 1.5) for i in range(1000)),
+    )
+    _LARGE_TEMPLATE.execute("COMMIT")
+
+
+def tearDownModule():
+    """Remove the scratch directory and every file the tests left in it."""
+    _LARGE_TEMPLATE.close()
+    _TMP.cleanup()
+
+
+def _scratch_connect(path):
+    """Open a throwaway database file: no rollback journal and no fsync."""
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA journal_mode=OFF")
+    conn.execute("PRAGMA synchronous=OFF")
+    conn.execute("PRAGMA locking_mode=EXCLUSIVE")
+    return conn
+
+
+def _build_db(path, stmts):
+    """Create a scratch database from statements run in one transaction.
+
+    Each item of ``stmts`` is either a SQL string or a ``(sql, rows)``
+    tuple, which is run with ``executemany``.
+    """
+    conn = _scratch_connect(path)
+    conn.execute("BEGIN")
+    for stmt in stmts:
+        if isinstance(stmt, tuple):
+            conn.executemany(*stmt)
+        else:
+            conn.execute(stmt)
+    conn.commit()
+    conn.close()
+
+
+def _clone_db(source, path):
+    """Copy a database connection's pages into a new file."""
+    dst = _scratch_connect(path)
+    source.backup(dst)
+    dst.close()
+
+
+def _json_loads(text):
+    """Parse JSON text, importing json on first use like sqliteexplorer."""
+    import json
+
+    return json.loads(text)
 
 
 class TestHelpers(unittest.TestCase):
@@ -55,164 +145,267 @@ class TestHelpers(unittest.TestCase):
         result = _format_size(1024 * 1024 * 1024)
         self.assertEqual(result, "1.0 GB")
 
+    def test_format_size_unit_boundaries(self):
+        """Test values on either side of a unit step and past the last unit."""
+        self.assertEqual(_format_size(1023), "1023 B")
+        self.assertEqual(_format_size(1536), "1.5 KB")
+        self.assertEqual(_format_size(1024 ** 4), "1.0 TB")
+        self.assertEqual(_format_size(2048 * 1024 ** 4), "2048.0 TB")
+
+    def test_format_size_float_and_fractional(self):
+        """Test float sizes, including sizes under one byte."""
+        self.assertEqual(_format_size(0.5), "0 B")
+        self.assertEqual(_format_size(512.0), "512 B")
+        self.assertEqual(_format_size(1536.0), "1.5 KB")
+
     def test_format_size_negative(self):
         """Test formatting negative values."""
         self.assertEqual(_format_size(-1), "N/A")
 
+    def test_build_parser_is_reused(self):
+        """Test the CLI parser is built once and still parses arguments."""
+        parser = _build_parser()
+        self.assertIs(_build_parser(), parser)
+        args = parser.parse_args(["browse", "x.db", "users", "--limit", "5"])
+        self.assertEqual(args.command, "browse")
+        self.assertEqual(args.limit, 5)
+
+    def test_format_memoized_matches_formatter(self):
+        """Test memoized formatting returns the formatter's output."""
+        rows = [["a", 1], ["b", 2.5]]
+        expected = TableFormatter.format_table(["k", "v"], rows)
+        self.assertEqual(
+            _format_memoized(TableFormatter.format_table, ["k", "v"], rows),
+            expected,
+        )
+
+    def test_format_memoized_keys_on_type(self):
+        """Test equal-but-differently-typed values don't share a cache entry."""
+        as_int = _format_memoized(TableFormatter.format_table, ["v"], [[1]])
+        as_bool = _format_memoized(TableFormatter.format_table, ["v"], [[True]])
+        self.assertIn("1", as_int)
+        self.assertIn("True", as_bool)
+
 
 class TestTableFormatter(unittest.TestCase):
     """Test the TableFormatter class."""
 
-    def test_format_table_basic(self):
-        """Test basic table formatting."""
-        headers = ["Name", "Age"]
-        rows = [["Alice", 30], ["Bob", 25]]
-        result = TableFormatter.format_table(headers, rows)
-        self.assertIn("Alice", result)
-        self.assertIn("Bob", result)
-        self.assertIn("Name", result)
-        self.assertIn("(2 rows)", result)
-
-    def test_format_table_empty(self):
-        """Test formatting empty table."""
-        headers = ["Name", "Age"]
-        rows = []
-        result = TableFormatter.format_table(headers, rows)
-        self.assertIn("(0 rows)", result)
-
-    def test_format_table_no_headers(self):
-        """Test formatting with no headers."""
-        result = TableFormatter.format_table([], [])
-        self.assertEqual(result, "(no columns)")
-
-    def test_format_table_truncation(self):
-        """Test long value truncation."""
-        headers = ["Value"]
-        rows = [["A" * 100]]
-        result = TableFormatter.format_table(headers, rows, max_width=20)
-        self.assertIn("...", result)
-
-    def test_format_table_null_values(self):
-        """Test NULL value display."""
-        headers = ["Value"]
-        rows = [[None]]
-        result = TableFormatter.format_table(headers, rows)
-        self.assertIn("NULL", result)
-
-    def test_format_table_blob_values(self):
-        """Test BLOB value display."""
-        headers = ["Data"]
-        rows = [[b"\x00\x01\x02"]]
-        result = TableFormatter.format_table(headers, rows)
-        self.assertIn("<BLOB 3 bytes>", result)
-
-    def test_format_table_with_title(self):
-        """Test table with title."""
-        headers = ["Col"]
-        rows = [["val"]]
-        result = TableFormatter.format_table(headers, rows, title="MY TABLE")
-        self.assertIn("MY TABLE", result)
-
-    def test_format_json(self):
-        """Test JSON formatting."""
-        data = {"key": "value", "num": 42}
-        result = TableFormatter.format_json(data)
-        parsed = json.loads(result)
-        self.assertEqual(parsed["key"], "value")
-        self.assertEqual(parsed["num"], 42)
-
-    def test_format_json_blob(self):
-        """Test JSON formatting of BLOB data."""
-        data = {"data": b"\x00\x01"}
-        result = TableFormatter.format_json(data)
-        self.assertIn("BLOB", result)
-
-    def test_format_csv(self):
-        """Test CSV formatting."""
-        headers = ["Name", "Age"]
-        rows = [["Alice", 30], ["Bob", 25]]
-        result = TableFormatter.format_csv_str(headers, rows)
-        self.assertIn("Name,Age", result)
-        self.assertIn("Alice,30", result)
-
-    def test_format_csv_null(self):
-        """Test CSV formatting with NULL."""
-        headers = ["Value"]
-        rows = [[None]]
-        result = TableFormatter.format_csv_str(headers, rows)
-        lines = result.strip().split("\n")
-        self.assertEqual(len(lines), 2)
-
-    def test_format_markdown(self):
-        """Test Markdown table formatting."""
-        headers = ["Name", "Age"]
-        rows = [["Alice", 30]]
-        result = TableFormatter.format_markdown(headers, rows)
-        self.assertIn("| Name | Age |", result)
-        self.assertIn("| --- | --- |", result)
-        self.assertIn("| Alice | 30 |", result)
-
-    def test_format_markdown_no_headers(self):
-        """Test Markdown with no headers."""
-        result = TableFormatter.format_markdown([], [])
-        self.assertEqual(result, "(no columns)")
-
-    def test_format_markdown_pipe_escape(self):
-        """Test Markdown pipe character escaping."""
-        headers = ["Value"]
-        rows = [["a|b"]]
-        result = TableFormatter.format_markdown(headers, rows)
-        self.assertIn("a\\|b", result)
-
-    def test_format_table_float_values(self):
-        """Test float value formatting."""
-        headers = ["Value"]
-        rows = [[3.14159265]]
-        result = TableFormatter.format_table(headers, rows)
-        self.assertIn("3.14159", result)
-
-    def test_format_table_newline_in_value(self):
-        """Test newline replacement in values."""
-        headers = ["Text"]
-        rows = [["line1\nline2"]]
-        result = TableFormatter.format_table(headers, rows)
-        self.assertIn("line1\\nline2", result)
-
-    def test_format_table_single_row(self):
-        """Test single row count display."""
-        headers = ["X"]
-        rows = [["a"]]
-        result = TableFormatter.format_table(headers, rows)
-        self.assertIn("(1 row)", result)
+    # (name, headers, rows, format_table kwargs, substrings of the output)
+    TABLE_CASES = [
+        ("basic", ["Name", "Age"], [["Alice", 30], ["Bob", 25]], {},
+         ["Alice", "Bob", "Name", "(2 rows)"]),
+        ("empty", ["Name", "Age"], [], {}, ["(0 rows)"]),
+        ("truncation", ["Value"], [["A" * 100]], {"max_width": 20},
+         ["| %s... |" % ("A" * 17)]),
+        ("null", ["Value"], [[None]], {}, ["NULL"]),
+        ("blob", ["Data"], [[b"\x00\x01\x02"]], {}, ["<BLOB 3 bytes>"]),
+        ("title", ["Col"], [["val"]], {"title": "MY TABLE"}, ["MY TABLE"]),
+        ("float", ["Value"], [[3.14159265]], {}, ["3.14159"]),
+        ("newline in value", ["Text"], [["line1\nline2"]], {},
+         ["line1\\nline2"]),
+        ("newline in header", ["a\r\nb"], [["x"]], {}, ["| a\\r\\nb |"]),
+        ("single row", ["X"], [["a"]], {}, ["(1 row)"]),
+        # Numeric columns are right-aligned, text left-aligned
+        ("numeric alignment", ["Name", "Count"], [["a", 5], ["b", None]], {},
+         ["| a    |     5 |", "| b    |  NULL |"]),
+        ("mixed column left-aligned", ["Value"], [[1], ["text"]], {},
+         ["| 1     |"]),
+        # Values of another type past the sampled rows still render
+        ("stray type after sample", ["N"],
+         [[i] for i in range(70)] + [["x\ny"], [b"\x00"]], {},
+         ["x\\ny", "<BLOB 1 bytes>"]),
+        ("short rows padded", ["A", "B"], [["x"], ["longer", "y"]], {},
+         ["| x      |   |", "| longer | y |"]),
+        ("float column with ints", ["Value"], [[0.5], [12], [None]], {},
+         ["|   0.5 |", "|    12 |", "|  NULL |"]),
+    ]
+
+    # (name, headers, rows, substrings of the output)
+    MARKDOWN_CASES = [
+        ("basic", ["Name", "Age"], [["Alice", 30]],
+         ["| Name | Age |", "| --- | --- |", "| Alice | 30 |"]),
+        ("pipe escape", ["Value"], [["a|b"]], ["a\\|b"]),
+        ("short row padded", ["A", "B"], [[None]], ["| NULL |  |"]),
+    ]
+
+    # (name, headers, rows, expected output lines)
+    CSV_CASES = [
+        ("basic", ["Name", "Age"], [["Alice", 30], ["Bob", 25]],
+         ["Name,Age", "Alice,30", "Bob,25"]),
+        ("null", ["Value"], [[None]], ["Value", '""']),
+    ]
+
+    # (name, data, expected result of parsing the JSON back)
+    JSON_CASES = [
+        ("plain", {"key": "value", "num": 42}, {"key": "value", "num": 42}),
+        ("blob", {"data": b"\x00\x01"}, {"data": "<BLOB 2 bytes>"}),
+        ("datetime and path",
+         {"when": datetime(2026, 2, 14, 12, 30), "where": Path("a.db")},
+         {"when": "2026-02-14T12:30:00", "where": str(Path("a.db"))}),
+    ]
+
+    def assertAllIn(self, needles, text):
+        """Assert every needle occurs in text, scanning text only once."""
+        pattern = re.compile("|".join(
+            re.escape(n) for n in sorted(set(needles), key=len, reverse=True)
+        ))
+        missing = set(needles).difference(pattern.findall(text))
+        # Needles hidden inside an overlapping match get a direct check
+        missing = [n for n in missing if n not in text]
+        if missing:
+            self.fail("%r not found in %r" % (missing, text))
+
+    def test_format_table_cases(self):
+        """Test aligned text table output for each case."""
+        for name, headers, rows, kwargs, expected in self.TABLE_CASES:
+            with self.subTest(name=name):
+                result = TableFormatter.format_table(headers, rows, **kwargs)
+                self.assertAllIn(expected, result)
+
+    def test_format_markdown_cases(self):
+        """Test Markdown table output for each case."""
+        for name, headers, rows, expected in self.MARKDOWN_CASES:
+            with self.subTest(name=name):
+                result = TableFormatter.format_markdown(headers, rows)
+                self.assertAllIn(expected, result)
+
+    def test_format_csv_cases(self):
+        """Test CSV output for each case."""
+        for name, headers, rows, expected in self.CSV_CASES:
+            with self.subTest(name=name):
+                result = TableFormatter.format_csv_str(headers, rows)
+                self.assertEqual(result.splitlines(), expected)
+
+    def test_format_json_cases(self):
+        """Test JSON output for each case, including non-JSON types."""
+        for name, data, expected in self.JSON_CASES:
+            with self.subTest(name=name):
+                parsed = _json_loads(TableFormatter.format_json(data))
+                self.assertEqual(parsed, expected)
+
+    def test_format_no_headers(self):
+        """Test table and Markdown output with no headers."""
+        self.assertEqual(TableFormatter.format_table([], []), "(no columns)")
+        self.assertEqual(TableFormatter.format_markdown([], []), "(no columns)")
+
+    def test_format_table_accepts_generator(self):
+        """Test a row generator formats the same as the equivalent list."""
+        headers = ["n", "label"]
+        rows = [[i, "row %d" % i] for i in range(100)]
+        self.assertEqual(
+            TableFormatter.format_table(headers, (r for r in rows)),
+            TableFormatter.format_table(headers, rows),
+        )
+        self.assertIn("(0 rows)", TableFormatter.format_table(headers, iter([])))
+
+    def test_format_json_stream(self):
+        """Test streamed JSON matches format_json output."""
+        records = [{"a": 1, "b": "x\ny"}, {"a": None, "b": [1, 2]}]
+        for data in (records, []):
+            output = io.StringIO()
+            TableFormatter.format_json_stream(iter(data), output)
+            self.assertEqual(output.getvalue(),
+                             TableFormatter.format_json(data))
+
+    def test_format_csv_stream(self):
+        """Test CSV streaming from a row iterator."""
+        headers = ["Name", "Data"]
+        rows = iter([("Alice", b"\x00"), ("Bob", None)])
+        output = io.StringIO()
+        TableFormatter.format_csv_stream(headers, rows, output)
+        self.assertEqual(
+            output.getvalue().splitlines(),
+            ["Name,Data", "Alice,<BLOB 1 bytes>", "Bob,"],
+        )
+
+    def test_format_csv_stream_multiple_batches(self):
+        """Test CSV streaming across several write batches."""
+        output = io.StringIO()
+        TableFormatter.format_csv_stream(
+            ["n"], ((i,) for i in range(2500)), output
+        )
+        lines = output.getvalue().splitlines()
+        self.assertEqual(len(lines), 2501)
+        self.assertEqual(lines[-1], "2499")
 
 
 class BaseDBTest(unittest.TestCase):
     """Base class with test database setup."""
 
+    # Class-wide explorer, set up by classes that call _open_shared_db()
+    db = None
+
+    @classmethod
+    def setUpClass(cls):
+        """Build the sample database once, in memory, for the whole class."""
+        # Autocommit mode; _create_test_db() issues its own BEGIN/COMMIT
+        cls._template = sqlite3.connect(":memory:", isolation_level=None)
+        cls._create_test_db(cls._template)
+
+    @classmethod
+    def tearDownClass(cls):
+        """Close the shared explorer and the in-memory template database."""
+        if cls.db is not None:
+            cls.db.close()
+            cls.db = None
+        cls._template.close()
+
+    @classmethod
+    def _open_shared_db(cls):
+        """Open one explorer on a class-wide copy for read-only tests."""
+        path = os.path.join(
+            _TMP.name, "shared_%d_%s.db" % (os.getpid(), cls.__name__)
+        )
+        cls._copy_template(path)
+        cls.db = SQLiteExplorer(path)
+
+    @classmethod
+    def _copy_template(cls, path):
+        """Copy the sample database into a new file."""
+        _clone_db(cls._template, path)
+
     def setUp(self):
-        """Create test database with sample data."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.db_path = os.path.join(self.temp_dir, "test.db")
-        self._create_test_db()
+        """Give this test a unique prefix for its scratch files."""
+        self._prefix = "test_%d_%s" % (os.getpid(), uuid.uuid4().hex)
+        self._db_path = None
+
+    @property
+    def db_path(self):
+        """This test's own copy of the sample database, made on first use.
+
+        Tests that only read through the shared explorer never touch it,
+        so they skip the copy entirely.
+        """
+        if self._db_path is None:
+            self._db_path = self.tmp_path("test.db")
+            self._copy_template(self._db_path)
+        return self._db_path
 
     def tearDown(self):
-        """Clean up test files."""
-        try:
-            if hasattr(self, "explorer") and self.explorer:
-                self.explorer.close()
-        except Exception:
-            pass
-        try:
-            for f in Path(self.temp_dir).glob("*"):
-                f.unlink()
-            Path(self.temp_dir).rmdir()
-        except Exception:
-            pass
-
-    def _create_test_db(self):
-        """Create a populated test database."""
-        conn = sqlite3.connect(self.db_path)
+        """Close the explorer if the test kept one open."""
+        if getattr(self, "explorer", None):
+            self.explorer.close()
+
+    def tmp_path(self, name):
+        """Return a path for a scratch file that is unique to this test."""
+        return os.path.join(_TMP.name, "%s_%s" % (self._prefix, name))
+
+    @staticmethod
+    def _create_test_db(conn):
+        """Create the sample tables, rows and indexes on a connection."""
         cursor = conn.cursor()
+        # Throwaway fixture: no durability, and one transaction for it all
+        cursor.executescript(
+            "PRAGMA journal_mode=MEMORY; PRAGMA synchronous=OFF; "
+            "PRAGMA temp_store=MEMORY; BEGIN;"
+        )
+
+        def insert_all(sql, row_template, rows):
+            # One multi-row INSERT with a flat parameter list per table
+            cursor.execute(
+                sql + ",".join([row_template] * len(rows)),
+                [value for row in rows for value in row],
+            )
 
         # Users table
         cursor.execute("""
@@ -236,9 +429,9 @@ class BaseDBTest(unittest.TestCase):
             ("Diana Prince", "diana@example.com", 28, 10000.00, "Hero", None),
             ("Eve Adams", None, None, 0.0, "Mystery person", None),
         ]
-        cursor.executemany(
-            "INSERT INTO users (name, email, age, balance, bio, avatar) VALUES (?, ?, ?, ?, ?, ?)",
-            users,
+        insert_all(
+            "INSERT INTO users (name, email, age, balance, bio, avatar) VALUES ",
+            "(?, ?, ?, ?, ?, ?)", users,
         )
 
         # Products table
@@ -258,9 +451,8 @@ class BaseDBTest(unittest.TestCase):
             (3, "Gadget X", 49.99, "Gadgets", 25),
             (4, "Tool Y", 29.99, "Tools", 0),
         ]
-        cursor.executemany(
-            "INSERT INTO products VALUES (?, ?, ?, ?, ?)", products
-        )
+        insert_all("INSERT INTO products VALUES ", "(?, ?, ?, ?, ?)",
+                   products)
 
         # Orders table (with foreign key)
         cursor.execute("""
@@ -280,16 +472,14 @@ class BaseDBTest(unittest.TestCase):
             (3, 2, 2, 3, 59.97),
             (4, 3, 1, 1, 9.99),
         ]
-        cursor.executemany(
-            "INSERT INTO orders VALUES (?, ?, ?, ?, ?, CURRENT_TIMESTAMP)", orders
-        )
+        insert_all("INSERT INTO orders VALUES ",
+                   "(?, ?, ?, ?, ?, CURRENT_TIMESTAMP)", orders)
 
         # Create an index
         cursor.execute("CREATE INDEX idx_users_email ON users(email)")
         cursor.execute("CREATE INDEX idx_orders_user ON orders(user_id)")
 
-        conn.commit()
-        conn.close()
+        conn.execute("COMMIT")
 
 
 class TestSQLiteExplorerInit(BaseDBTest):
@@ -319,7 +509,45 @@ class TestSQLiteExplorerInit(BaseDBTest):
     def test_init_directory_path(self):
         """Test initialization with directory instead of file."""
         with self.assertRaises(ValueError):
-            SQLiteExplorer(self.temp_dir)
+            SQLiteExplorer(_TMP.name)
+
+    def test_read_connection_pragmas(self):
+        """Test read-only connections get the tuned PRAGMAs."""
+        with SQLiteExplorer(self.db_path) as db:
+            self.assertEqual(db.query("PRAGMA query_only")["rows"][0][0], 1)
+            self.assertEqual(db.query("PRAGMA cache_size")["rows"][0][0], -65536)
+            with self.assertRaises(sqlite3.OperationalError):
+                db.query("DELETE FROM users")
+
+    def test_read_connection_does_not_block_writers(self):
+        """Test the default explorer leaves the file writable by others."""
+        with SQLiteExplorer(self.db_path) as db:
+            mode = db.query("PRAGMA locking_mode")["rows"][0][0]
+            self.assertEqual(mode, "normal")
+            conn = sqlite3.connect(self.db_path, timeout=0)
+            conn.execute("INSERT INTO products VALUES (5, 'Z', 1.0, 'Z', 1)")
+            conn.commit()
+            conn.close()
+
+    def test_read_connection_holds_lock_when_exclusive(self):
+        """Test exclusive_lock reads rollback-journal databases exclusively."""
+        with SQLiteExplorer(self.db_path, exclusive_lock=True) as db:
+            mode = db.query("PRAGMA locking_mode")["rows"][0][0]
+            self.assertEqual(mode, "exclusive")
+
+    def test_wal_database_with_open_writer(self):
+        """Test WAL databases stay readable while a writer is connected."""
+        wal_path = self.tmp_path("wal.db")
+        writer = sqlite3.connect(wal_path)
+        try:
+            writer.execute("PRAGMA journal_mode=WAL")
+            writer.execute("CREATE TABLE t (x INTEGER)")
+            writer.execute("INSERT INTO t VALUES (1)")
+            writer.commit()
+            with SQLiteExplorer(wal_path) as db:
+                self.assertEqual(db.get_tables()[0]["row_count"], 1)
+        finally:
+            writer.close()
 
     def test_context_manager(self):
         """Test context manager support."""
@@ -327,240 +555,450 @@ class TestSQLiteExplorerInit(BaseDBTest):
             tables = db.get_tables()
             self.assertIsNotNone(tables)
 
+    def test_immutable_reads_without_locking(self):
+        """Test immutable mode reads the file and holds no lock on it."""
+        with SQLiteExplorer(self.db_path, immutable=True) as db:
+            self.assertEqual(len(db.get_tables()), 3)
+            mode = db._connect().execute("PRAGMA locking_mode").fetchone()[0]
+            self.assertEqual(mode, "normal")
+            # A writer is not blocked by the open explorer
+            conn = sqlite3.connect(self.db_path, timeout=0)
+            conn.execute("CREATE TABLE scratch (x)")
+            conn.commit()
+            conn.close()
+
 
 class TestGetInfo(BaseDBTest):
     """Test get_info() functionality."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Share one explorer across this class's read-only tests."""
+        super().setUpClass()
+        cls._open_shared_db()
+
     def test_info_returns_dict(self):
         """Test info returns a dictionary."""
-        with SQLiteExplorer(self.db_path) as db:
-            info = db.get_info()
-            self.assertIsInstance(info, dict)
+        db = self.db
+        info = db.get_info()
+        self.assertIsInstance(info, dict)
 
     def test_info_has_required_fields(self):
         """Test info has all required fields."""
-        with SQLiteExplorer(self.db_path) as db:
-            info = db.get_info()
-            required = [
-                "path", "file_size", "file_size_display", "modified",
-                "sqlite_version", "page_size", "page_count",
-                "table_count", "index_count",
-            ]
-            for field in required:
-                self.assertIn(field, info, "Missing field: %s" % field)
+        db = self.db
+        info = db.get_info()
+        required = [
+            "path", "file_size", "file_size_display", "modified",
+            "sqlite_version", "page_size", "page_count",
+            "table_count", "index_count",
+        ]
+        for field in required:
+            self.assertIn(field, info, "Missing field: %s" % field)
 
     def test_info_correct_table_count(self):
         """Test info reports correct table count."""
-        with SQLiteExplorer(self.db_path) as db:
-            info = db.get_info()
-            self.assertEqual(info["table_count"], 3)
+        db = self.db
+        info = db.get_info()
+        self.assertEqual(info["table_count"], 3)
 
     def test_info_correct_index_count(self):
         """Test info reports correct index count."""
+        db = self.db
+        info = db.get_info()
+        # 2 explicit indexes + sqlite autoindex for UNIQUE
+        self.assertGreaterEqual(info["index_count"], 2)
+
+    def test_info_object_counts_and_pragmas(self):
+        """Test view/trigger counts and PRAGMA values from the combined query."""
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("CREATE VIEW v_users AS SELECT name FROM users")
+        conn.execute(
+            "CREATE TRIGGER trg AFTER INSERT ON users BEGIN SELECT 1; END"
+        )
+        conn.commit()
+        conn.close()
         with SQLiteExplorer(self.db_path) as db:
             info = db.get_info()
-            # 2 explicit indexes + sqlite autoindex for UNIQUE
-            self.assertGreaterEqual(info["index_count"], 2)
+            self.assertEqual(info["view_count"], 1)
+            self.assertEqual(info["trigger_count"], 1)
+            self.assertEqual(info["index_count"], 2)
+            self.assertEqual(info["encoding"], "UTF-8")
+            self.assertEqual(info["journal_mode"], "delete")
+            self.assertEqual(info["sqlite_version"], sqlite3.sqlite_version)
 
     def test_info_file_size_positive(self):
         """Test info reports positive file size."""
-        with SQLiteExplorer(self.db_path) as db:
-            info = db.get_info()
-            self.assertGreater(info["file_size"], 0)
+        db = self.db
+        info = db.get_info()
+        self.assertGreater(info["file_size"], 0)
+
+    def test_info_and_size_cached_as_copies(self):
+        """Test repeated info/size calls are served from the cache as copies."""
+        db = self.db
+        info = db.get_info()
+        info["table_count"] = -1
+        self.assertEqual(db.get_info()["table_count"], 3)
+        size = db.get_size()
+        size["tables"].clear()
+        self.assertEqual(len(db.get_size()["tables"]), 3)
+        self.assertIn(("info",), db._schema_cache)
+        self.assertIn(("size",), db._schema_cache)
 
 
 class TestGetTables(BaseDBTest):
     """Test get_tables() functionality."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Share one explorer across this class's read-only tests."""
+        super().setUpClass()
+        cls._open_shared_db()
+
     def test_tables_returns_list(self):
         """Test tables returns a list."""
-        with SQLiteExplorer(self.db_path) as db:
-            tables = db.get_tables()
-            self.assertIsInstance(tables, list)
+        db = self.db
+        tables = db.get_tables()
+        self.assertIsInstance(tables, list)
 
     def test_tables_correct_count(self):
         """Test correct number of tables returned."""
-        with SQLiteExplorer(self.db_path) as db:
-            tables = db.get_tables()
-            self.assertEqual(len(tables), 3)
+        db = self.db
+        tables = db.get_tables()
+        self.assertEqual(len(tables), 3)
 
     def test_tables_have_names(self):
         """Test tables have expected names."""
-        with SQLiteExplorer(self.db_path) as db:
-            tables = db.get_tables()
-            names = [t["name"] for t in tables]
-            self.assertIn("users", names)
-            self.assertIn("products", names)
-            self.assertIn("orders", names)
+        db = self.db
+        tables = db.get_tables()
+        names = [t["name"] for t in tables]
+        self.assertIn("users", names)
+        self.assertIn("products", names)
+        self.assertIn("orders", names)
 
     def test_tables_row_counts(self):
         """Test tables have correct row counts."""
-        with SQLiteExplorer(self.db_path) as db:
-            tables = db.get_tables()
-            for t in tables:
-                if t["name"] == "users":
-                    self.assertEqual(t["row_count"], 5)
-                elif t["name"] == "products":
-                    self.assertEqual(t["row_count"], 4)
-                elif t["name"] == "orders":
-                    self.assertEqual(t["row_count"], 4)
+        db = self.db
+        tables = db.get_tables()
+        for t in tables:
+            if t["name"] == "users":
+                self.assertEqual(t["row_count"], 5)
+            elif t["name"] == "products":
+                self.assertEqual(t["row_count"], 4)
+            elif t["name"] == "orders":
+                self.assertEqual(t["row_count"], 4)
+
+    def test_tables_approximate_row_counts(self):
+        """Test dbstat-based row counts match exact counts for rowid tables."""
+        db = self.db
+        exact = {t["name"]: t["row_count"] for t in db.get_tables()}
+        approx = {
+            t["name"]: t["row_count"]
+            for t in db.get_tables(approximate=True)
+        }
+        self.assertEqual(approx, exact)
 
     def test_tables_column_counts(self):
         """Test tables report column counts."""
-        with SQLiteExplorer(self.db_path) as db:
-            tables = db.get_tables()
-            for t in tables:
-                self.assertGreater(t["column_count"], 0)
+        db = self.db
+        tables = db.get_tables()
+        for t in tables:
+            self.assertGreater(t["column_count"], 0)
 
 
 class TestGetSchema(BaseDBTest):
     """Test get_schema() functionality."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Share one explorer across this class's read-only tests."""
+        super().setUpClass()
+        cls._open_shared_db()
+
     def test_schema_single_table(self):
         """Test getting schema for a single table."""
-        with SQLiteExplorer(self.db_path) as db:
-            schema = db.get_schema("users")
-            self.assertEqual(len(schema), 1)
-            self.assertEqual(schema[0]["table"], "users")
+        db = self.db
+        schema = db.get_schema("users")
+        self.assertEqual(len(schema), 1)
+        self.assertEqual(schema[0]["table"], "users")
 
     def test_schema_all_tables(self):
         """Test getting schema for all tables."""
-        with SQLiteExplorer(self.db_path) as db:
-            schema = db.get_schema()
-            self.assertEqual(len(schema), 3)
+        db = self.db
+        schema = db.get_schema()
+        self.assertEqual(len(schema), 3)
 
     def test_schema_columns(self):
         """Test schema has correct columns for users table."""
-        with SQLiteExplorer(self.db_path) as db:
-            schema = db.get_schema("users")
-            col_names = [c["name"] for c in schema[0]["columns"]]
-            self.assertIn("id", col_names)
-            self.assertIn("name", col_names)
-            self.assertIn("email", col_names)
-            self.assertIn("age", col_names)
+        db = self.db
+        schema = db.get_schema("users")
+        col_names = [c["name"] for c in schema[0]["columns"]]
+        self.assertIn("id", col_names)
+        self.assertIn("name", col_names)
+        self.assertIn("email", col_names)
+        self.assertIn("age", col_names)
 
     def test_schema_column_types(self):
         """Test schema reports column types."""
-        with SQLiteExplorer(self.db_path) as db:
-            schema = db.get_schema("users")
-            cols = {c["name"]: c for c in schema[0]["columns"]}
-            self.assertEqual(cols["id"]["type"], "INTEGER")
-            self.assertEqual(cols["name"]["type"], "TEXT")
-            self.assertEqual(cols["age"]["type"], "INTEGER")
+        db = self.db
+        schema = db.get_schema("users")
+        cols = {c["name"]: c for c in schema[0]["columns"]}
+        self.assertEqual(cols["id"]["type"], "INTEGER")
+        self.assertEqual(cols["name"]["type"], "TEXT")
+        self.assertEqual(cols["age"]["type"], "INTEGER")
 
     def test_schema_primary_key(self):
         """Test schema identifies primary key."""
-        with SQLiteExplorer(self.db_path) as db:
-            schema = db.get_schema("users")
-            cols = {c["name"]: c for c in schema[0]["columns"]}
-            self.assertTrue(cols["id"]["pk"])
+        db = self.db
+        schema = db.get_schema("users")
+        cols = {c["name"]: c for c in schema[0]["columns"]}
+        self.assertTrue(cols["id"]["pk"])
 
     def test_schema_indexes(self):
         """Test schema includes indexes."""
+        db = self.db
+        schema = db.get_schema("users")
+        idx_names = [i["name"] for i in schema[0]["indexes"]]
+        self.assertIn("idx_users_email", idx_names)
+
+    def test_schema_multi_column_index_grouped(self):
+        """Test composite index columns are grouped under one index."""
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("CREATE UNIQUE INDEX idx_name_age ON users(name, age)")
+        conn.commit()
+        conn.close()
         with SQLiteExplorer(self.db_path) as db:
             schema = db.get_schema("users")
-            idx_names = [i["name"] for i in schema[0]["indexes"]]
-            self.assertIn("idx_users_email", idx_names)
+            idx = {i["name"]: i for i in schema[0]["indexes"]}
+            self.assertEqual(idx["idx_name_age"]["columns"], ["name", "age"])
+            self.assertTrue(idx["idx_name_age"]["unique"])
+            self.assertEqual(idx["idx_users_email"]["columns"], ["email"])
+
+    def test_schema_foreign_keys_per_table(self):
+        """Test foreign keys are attached to the right tables."""
+        db = self.db
+        schemas = {s["table"]: s for s in db.get_schema()}
+        fk_targets = sorted(
+            fk["table"] for fk in schemas["orders"]["foreign_keys"]
+        )
+        self.assertEqual(fk_targets, ["products", "users"])
+        self.assertEqual(schemas["users"]["foreign_keys"], [])
+        self.assertEqual(schemas["products"]["indexes"], [])
 
     def test_schema_create_sql(self):
         """Test schema includes CREATE SQL."""
-        with SQLiteExplorer(self.db_path) as db:
-            schema = db.get_schema("users")
-            self.assertIn("CREATE TABLE", schema[0]["create_sql"])
+        db = self.db
+        schema = db.get_schema("users")
+        self.assertIn("CREATE TABLE", schema[0]["create_sql"])
 
     def test_schema_nonexistent_table(self):
         """Test schema raises error for nonexistent table."""
+        db = self.db
+        with self.assertRaises(ValueError) as ctx:
+            db.get_schema("nonexistent")
+        self.assertIn("not found", str(ctx.exception))
+
+    def test_schema_nonexistent_skips_row_counts(self):
+        """Test the unknown-table error lists tables without COUNT(*)."""
         with SQLiteExplorer(self.db_path) as db:
+            statements = []
+            db._connect().set_trace_callback(statements.append)
             with self.assertRaises(ValueError) as ctx:
                 db.get_schema("nonexistent")
-            self.assertIn("not found", str(ctx.exception))
+        self.assertIn("orders, products, users", str(ctx.exception))
+        self.assertFalse(
+            [sql for sql in statements if "COUNT(*)" in sql]
+        )
+
+    def test_schema_cache_warm(self):
+        """Test a repeated get_schema() call skips the introspection queries."""
+        with SQLiteExplorer(self.db_path) as db:
+            cold = db.get_schema("users")
+            loads = []
+            db._load_schema = loads.append
+            self.assertEqual(db.get_schema("users"), cold)
+            self.assertEqual(loads, [])
+
+    def test_schema_cache_returns_copies(self):
+        """Test callers can't modify cached schema results."""
+        db = self.db
+        db.get_schema("users")[0]["columns"].clear()
+        db.get_tables()[0]["name"] = "changed"
+        self.assertGreater(len(db.get_schema("users")[0]["columns"]), 0)
+        self.assertNotEqual(db.get_tables()[0]["name"], "changed")
+
+    def test_schema_cache_sees_other_writers(self):
+        """Test cached results are refreshed after another connection commits."""
+        with SQLiteExplorer(self.db_path) as db:
+            before = {t["name"]: t["row_count"] for t in db.get_tables()}
+            conn = sqlite3.connect(self.db_path)
+            conn.execute("INSERT INTO products VALUES (5, 'Z', 1.0, 'Z', 1)")
+            conn.execute("CREATE TABLE extra (x)")
+            conn.commit()
+            conn.close()
+            after = {t["name"]: t["row_count"] for t in db.get_tables()}
+            self.assertEqual(after["products"], before["products"] + 1)
+            self.assertIn("extra", after)
+            self.assertIn("extra", [s["table"] for s in db.get_schema()])
 
 
 class TestBrowse(BaseDBTest):
     """Test browse() functionality."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Share one explorer across this class's read-only tests."""
+        super().setUpClass()
+        cls._open_shared_db()
+
     def test_browse_basic(self):
         """Test basic table browsing."""
-        with SQLiteExplorer(self.db_path) as db:
-            result = db.browse("users")
-            self.assertEqual(len(result["rows"]), 5)
-            self.assertEqual(result["total_rows"], 5)
+        db = self.db
+        result = db.browse("users")
+        self.assertEqual(len(result["rows"]), 5)
+        self.assertEqual(result["total_rows"], 5)
 
     def test_browse_with_limit(self):
         """Test browsing with row limit."""
-        with SQLiteExplorer(self.db_path) as db:
-            result = db.browse("users", limit=2)
-            self.assertEqual(len(result["rows"]), 2)
-            self.assertEqual(result["total_rows"], 5)
+        db = self.db
+        result = db.browse("users", limit=2)
+        self.assertEqual(len(result["rows"]), 2)
+        self.assertEqual(result["total_rows"], 5)
 
     def test_browse_with_offset(self):
         """Test browsing with offset."""
-        with SQLiteExplorer(self.db_path) as db:
-            result = db.browse("users", limit=2, offset=3)
-            self.assertEqual(len(result["rows"]), 2)
+        db = self.db
+        result = db.browse("users", limit=2, offset=3)
+        self.assertEqual(len(result["rows"]), 2)
 
     def test_browse_with_where(self):
         """Test browsing with WHERE filter."""
-        with SQLiteExplorer(self.db_path) as db:
-            result = db.browse("users", where="age > 28")
-            self.assertEqual(len(result["rows"]), 2)  # Alice (30), Charlie (35)
+        db = self.db
+        result = db.browse("users", where="age > 28")
+        self.assertEqual(len(result["rows"]), 2)  # Alice (30), Charlie (35)
 
     def test_browse_with_order(self):
         """Test browsing with ORDER BY."""
-        with SQLiteExplorer(self.db_path) as db:
-            result = db.browse("users", order_by="age DESC")
-            # First row should be Charlie (35)
-            self.assertEqual(result["rows"][0][1], "Charlie Brown")
+        db = self.db
+        result = db.browse("users", order_by="age DESC")
+        # First row should be Charlie (35)
+        self.assertEqual(result["rows"][0][1], "Charlie Brown")
+
+    def test_browse_keyset_pagination(self):
+        """Test paging by rowid walks the table without OFFSET."""
+        db = self.db
+        first = db.browse("users", limit=2, after_rowid=0)
+        self.assertEqual([r[0] for r in first["rows"]], [1, 2])
+        self.assertEqual(first["next_cursor"], 2)
+        second = db.browse("users", limit=2,
+                           after_rowid=first["next_cursor"])
+        self.assertEqual([r[0] for r in second["rows"]], [3, 4])
+        self.assertEqual(second["headers"], first["headers"])
+        self.assertEqual(len(second["rows"][0]), len(first["headers"]))
+        last = db.browse("users", limit=10, after_rowid=5)
+        self.assertEqual(last["rows"], [])
+        self.assertIsNone(last["next_cursor"])
+
+    def test_browse_keyset_with_where(self):
+        """Test rowid paging combined with a WHERE filter."""
+        db = self.db
+        result = db.browse("users", after_rowid=1, where="age > 26 OR age IS NULL")
+        self.assertEqual([r[0] for r in result["rows"]], [3, 4, 5])
+        with self.assertRaises(ValueError):
+            db.browse("users", after_rowid=0, order_by="name")
 
     def test_browse_nonexistent_table(self):
         """Test browsing nonexistent table."""
-        with SQLiteExplorer(self.db_path) as db:
-            with self.assertRaises(ValueError):
-                db.browse("nonexistent")
+        db = self.db
+        with self.assertRaises(ValueError):
+            db.browse("nonexistent")
+
+    def test_browse_nonexistent_lists_available(self):
+        """Test the not-found error lists user tables only."""
+        db = self.db
+        with self.assertRaises(ValueError) as ctx:
+            db.browse("nonexistent")
+        self.assertIn("orders, products, users", str(ctx.exception))
+        self.assertNotIn("sqlite_sequence", str(ctx.exception))
+        # Internal tables can still be browsed by name
+        self.assertGreater(db.browse("sqlite_sequence")["total_rows"], 0)
 
     def test_browse_showing_string(self):
         """Test browse returns correct 'showing' string."""
-        with SQLiteExplorer(self.db_path) as db:
-            result = db.browse("users", limit=2, offset=0)
-            self.assertEqual(result["showing"], "1-2 of 5")
+        db = self.db
+        result = db.browse("users", limit=2, offset=0)
+        self.assertEqual(result["showing"], "1-2 of 5")
 
 
 class TestQuery(BaseDBTest):
     """Test query() functionality."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Share one explorer across this class's read-only tests."""
+        super().setUpClass()
+        cls._open_shared_db()
+
     def test_query_select(self):
         """Test basic SELECT query."""
-        with SQLiteExplorer(self.db_path) as db:
-            result = db.query("SELECT * FROM users LIMIT 3")
-            self.assertEqual(result["row_count"], 3)
-            self.assertIn("name", result["headers"])
+        db = self.db
+        result = db.query("SELECT * FROM users LIMIT 3")
+        self.assertEqual(result["row_count"], 3)
+        self.assertIn("name", result["headers"])
 
     def test_query_aggregate(self):
         """Test aggregate query."""
-        with SQLiteExplorer(self.db_path) as db:
-            result = db.query("SELECT COUNT(*) as cnt FROM users")
-            self.assertEqual(result["rows"][0][0], 5)
+        db = self.db
+        result = db.query("SELECT COUNT(*) as cnt FROM users")
+        self.assertEqual(result["rows"][0][0], 5)
 
     def test_query_join(self):
         """Test JOIN query."""
-        with SQLiteExplorer(self.db_path) as db:
-            result = db.query(
-                "SELECT u.name, o.total FROM users u "
-                "JOIN orders o ON u.id = o.user_id"
-            )
-            self.assertGreater(result["row_count"], 0)
+        db = self.db
+        result = db.query(
+            "SELECT u.name, o.total FROM users u "
+            "JOIN orders o ON u.id = o.user_id"
+        )
+        self.assertGreater(result["row_count"], 0)
 
     def test_query_syntax_error(self):
         """Test query with SQL syntax error."""
-        with SQLiteExplorer(self.db_path) as db:
-            with self.assertRaises(sqlite3.OperationalError):
-                db.query("SELCT * FORM users")
+        db = self.db
+        with self.assertRaises(sqlite3.OperationalError):
+            db.query("SELCT * FORM users")
 
     def test_query_empty_result(self):
         """Test query returning no rows."""
-        with SQLiteExplorer(self.db_path) as db:
-            result = db.query("SELECT * FROM users WHERE age > 1000")
-            self.assertEqual(result["row_count"], 0)
+        db = self.db
+        result = db.query("SELECT * FROM users WHERE age > 1000")
+        self.assertEqual(result["row_count"], 0)
+
+    def test_query_columns_typed_storage(self):
+        """Test columnar results use typed arrays for numeric columns."""
+        db = self.db
+        result = db.query_columns(
+            "SELECT id, price, name, category FROM products ORDER BY id"
+        )
+        self.assertEqual(result["row_count"], 4)
+        ids, prices, names, _ = result["columns"]
+        self.assertEqual(ids.typecode, "q")
+        self.assertEqual(list(ids), [1, 2, 3, 4])
+        self.assertEqual(prices.typecode, "d")
+        self.assertAlmostEqual(sum(prices), 109.96)
+        self.assertEqual(names[0], "Widget A")
+        # NULLs make a plain list
+        ages = db.query_columns("SELECT age FROM users")["columns"][0]
+        self.assertIsInstance(ages, list)
+        self.assertIn(None, ages)
+
+    def test_display_query_streams_json(self):
+        """Test JSON query output written to a stream matches the string form."""
+        sql = "SELECT * FROM users ORDER BY id"
+        db = self.db
+        expected = _display_query(db, sql, "json")
+        out = io.StringIO()
+        self.assertEqual(_display_query(db, sql, "json", out=out), "")
+        self.assertEqual(out.getvalue(), expected)
+        self.assertEqual(_json_loads(expected)["row_count"], 5)
 
 
 class TestExport(BaseDBTest):
@@ -579,9 +1017,18 @@ class TestExport(BaseDBTest):
         """Test JSON export."""
         with SQLiteExplorer(self.db_path) as db:
             content = db.export_table("products", fmt="json")
-            data = json.loads(content)
-            self.assertEqual(len(data), 4)
-            self.assertEqual(data[0]["name"], "Widget A")
+        data = _json_loads(content)
+        self.assertEqual(len(data), 4)
+        self.assertEqual(data[0]["name"], "Widget A")
+
+    def test_export_jsonl(self):
+        """Test JSON Lines export, one record per line."""
+        with SQLiteExplorer(self.db_path) as db:
+            content = db.export_table("users", fmt="jsonl")
+            records = [_json_loads(line) for line in content.splitlines()]
+            self.assertEqual(len(records), 5)
+            self.assertEqual(records[0]["name"], "Alice Smith")
+            self.assertEqual(records[1]["avatar"], "<BLOB 4 bytes>")
 
     def test_export_markdown(self):
         """Test Markdown export."""
@@ -592,12 +1039,26 @@ class TestExport(BaseDBTest):
 
     def test_export_to_file(self):
         """Test export to file."""
-        output_path = os.path.join(self.temp_dir, "export.csv")
+        output_path = self.tmp_path("export.csv")
         with SQLiteExplorer(self.db_path) as db:
             db.export_table("products", fmt="csv", output=output_path)
-            self.assertTrue(os.path.exists(output_path))
-            content = Path(output_path).read_text()
-            self.assertIn("Widget A", content)
+        self.assertGreater(os.stat(output_path).st_size, 0)
+        with open(output_path, "rb") as f:
+            head = f.read(8192)
+        self.assertIn(b"Widget A", head)
+
+    def test_export_to_file_matches_string(self):
+        """Test streamed file export matches the returned string."""
+        with SQLiteExplorer(self.db_path) as db:
+            for fmt in ("csv", "json", "md"):
+                output_path = self.tmp_path("export." + fmt)
+                self.assertEqual(
+                    db.export_table("users", fmt=fmt, output=output_path), ""
+                )
+                with open(output_path, encoding="utf-8", newline="") as f:
+                    self.assertEqual(
+                        f.read(), db.export_table("users", fmt=fmt)
+                    )
 
     def test_export_with_query(self):
         """Test export with custom query."""
@@ -606,7 +1067,7 @@ class TestExport(BaseDBTest):
                 "products", fmt="json",
                 query_sql="SELECT name, price FROM products WHERE price > 20"
             )
-            data = json.loads(content)
+            data = _json_loads(content)
             self.assertEqual(len(data), 2)  # Gadget X, Tool Y
 
     def test_export_nonexistent_table(self):
@@ -615,132 +1076,288 @@ class TestExport(BaseDBTest):
             with self.assertRaises(ValueError):
                 db.export_table("nonexistent", fmt="csv")
 
+    def test_export_error_keeps_existing_file(self):
+        """Test a failed export leaves an existing output file untouched."""
+        output = self.tmp_path("keep.csv")
+        with open(output, "w") as f:
+            f.write("previous export\n")
+        with SQLiteExplorer(self.db_path) as db:
+            with self.assertRaises(ValueError):
+                db.export_table("nonexistent", output=output)
+            with self.assertRaises(sqlite3.OperationalError):
+                db.export_table("users", output=output,
+                                query_sql="SELECT * FROM nonexistent")
+        with open(output) as f:
+            self.assertEqual(f.read(), "previous export\n")
+
 
 class TestGetStats(BaseDBTest):
     """Test get_stats() functionality."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Compute the stats under test once for the whole class."""
+        super().setUpClass()
+        cls._open_shared_db()
+        cls.users_stats = cls.db.get_stats("users")
+        cls.products_stats = cls.db.get_stats("products")
+
     def test_stats_returns_list(self):
         """Test stats returns a list of column stats."""
-        with SQLiteExplorer(self.db_path) as db:
-            stats = db.get_stats("users")
-            self.assertIsInstance(stats, list)
-            self.assertGreater(len(stats), 0)
+        self.assertIsInstance(self.users_stats, list)
+        self.assertGreater(len(self.users_stats), 0)
 
     def test_stats_column_names(self):
         """Test stats has correct column names."""
-        with SQLiteExplorer(self.db_path) as db:
-            stats = db.get_stats("users")
-            col_names = [s["column"] for s in stats]
-            self.assertIn("name", col_names)
-            self.assertIn("age", col_names)
+        col_names = [s["column"] for s in self.users_stats]
+        self.assertIn("name", col_names)
+        self.assertIn("age", col_names)
 
     def test_stats_null_counts(self):
         """Test stats correctly counts NULLs."""
-        with SQLiteExplorer(self.db_path) as db:
-            stats = db.get_stats("users")
-            age_stat = next(s for s in stats if s["column"] == "age")
-            self.assertEqual(age_stat["null_count"], 1)  # Eve has NULL age
+        age_stat = next(s for s in self.users_stats if s["column"] == "age")
+        self.assertEqual(age_stat["null_count"], 1)  # Eve has NULL age
 
     def test_stats_distinct_counts(self):
         """Test stats correctly counts distinct values."""
-        with SQLiteExplorer(self.db_path) as db:
-            stats = db.get_stats("products")
-            cat_stat = next(s for s in stats if s["column"] == "category")
-            self.assertEqual(cat_stat["distinct"], 3)
+        cat_stat = next(
+            s for s in self.products_stats if s["column"] == "category"
+        )
+        self.assertEqual(cat_stat["distinct"], 3)
 
     def test_stats_numeric_aggregates(self):
         """Test stats computes min/max/avg for numeric columns."""
+        price_stat = next(
+            s for s in self.products_stats if s["column"] == "price"
+        )
+        self.assertIsNotNone(price_stat["min"])
+        self.assertIsNotNone(price_stat["max"])
+        self.assertIsNotNone(price_stat["avg"])
+
+    def test_stats_single_pass_values(self):
+        """Test fused aggregates land on the right columns."""
+        stats = {s["column"]: s for s in self.products_stats}
+        self.assertEqual(stats["stock"]["min"], 0)
+        self.assertEqual(stats["stock"]["max"], 100)
+        self.assertEqual(stats["stock"]["sum"], 175)
+        self.assertEqual(stats["name"]["min"], "Gadget X")
+        self.assertEqual(stats["id"]["total_rows"], 4)
+
+    def test_stats_sum_overflow(self):
+        """Test integer overflow in SUM keeps the other statistics."""
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("CREATE TABLE big (n INTEGER)")
+        conn.executemany("INSERT INTO big VALUES (?)", [(2 ** 62,)] * 3)
+        conn.commit()
+        conn.close()
         with SQLiteExplorer(self.db_path) as db:
-            stats = db.get_stats("products")
-            price_stat = next(s for s in stats if s["column"] == "price")
-            self.assertIsNotNone(price_stat["min"])
-            self.assertIsNotNone(price_stat["max"])
-            self.assertIsNotNone(price_stat["avg"])
+            stat = db.get_stats("big")[0]
+            self.assertIsNone(stat["sum"])
+            self.assertEqual(stat["max"], 2 ** 62)
+            self.assertEqual(stat["non_null"], 3)
+
+    def test_stats_wide_table(self):
+        """Test tables too wide for one aggregate SELECT are batched."""
+        wide_path = self.tmp_path("wide.db")
+        cols = ", ".join("c%d INTEGER" % i for i in range(400))
+        _build_db(wide_path, [
+            "CREATE TABLE wide (%s)" % cols,
+            ("INSERT INTO wide VALUES (%s)" % ", ".join("?" * 400),
+             [tuple(range(400)), tuple(range(1, 401))]),
+        ])
+        with SQLiteExplorer(wide_path) as db:
+            stats = db.get_stats("wide")
+        self.assertEqual(len(stats), 400)
+        last = stats[-1]
+        self.assertEqual(last["column"], "c399")
+        self.assertEqual((last["min"], last["max"], last["sum"]),
+                         (399, 400, 799))
+        self.assertEqual(last["total_rows"], 2)
 
     def test_stats_nonexistent_table(self):
         """Test stats for nonexistent table."""
-        with SQLiteExplorer(self.db_path) as db:
-            with self.assertRaises(ValueError):
-                db.get_stats("nonexistent")
+        db = self.db
+        with self.assertRaises(ValueError):
+            db.get_stats("nonexistent")
 
 
 class TestSearch(BaseDBTest):
     """Test search() functionality."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Share one explorer across this class's read-only tests."""
+        super().setUpClass()
+        cls._open_shared_db()
+
     def test_search_finds_match(self):
         """Test search finds matching text."""
-        with SQLiteExplorer(self.db_path) as db:
-            matches = db.search("Alice")
-            self.assertGreater(len(matches), 0)
-            self.assertEqual(matches[0]["table"], "users")
+        db = self.db
+        matches = db.search("Alice")
+        self.assertGreater(len(matches), 0)
+        self.assertEqual(matches[0]["table"], "users")
 
     def test_search_case_insensitive(self):
         """Test search is case-insensitive."""
-        with SQLiteExplorer(self.db_path) as db:
-            matches = db.search("alice")
-            self.assertGreater(len(matches), 0)
+        db = self.db
+        matches = db.search("alice")
+        self.assertGreater(len(matches), 0)
 
     def test_search_across_tables(self):
         """Test search across multiple tables."""
-        with SQLiteExplorer(self.db_path) as db:
-            matches = db.search("Widget")
-            self.assertGreater(len(matches), 0)
-            tables = set(m["table"] for m in matches)
-            self.assertIn("products", tables)
+        db = self.db
+        matches = db.search("Widget")
+        self.assertGreater(len(matches), 0)
+        tables = set(m["table"] for m in matches)
+        self.assertIn("products", tables)
 
     def test_search_with_table_filter(self):
         """Test search limited to specific tables."""
+        db = self.db
+        matches = db.search("Alice", tables=["products"])
+        self.assertEqual(len(matches), 0)
+
+    def test_search_named_view(self):
+        """Test views passed in tables= are searched like tables."""
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("CREATE VIEW v_users AS SELECT id, name FROM users")
+        conn.execute("CREATE TABLE gone (x TEXT)")
+        conn.execute("CREATE VIEW v_broken AS SELECT x FROM gone")
+        conn.execute("DROP TABLE gone")
+        conn.commit()
+        conn.close()
         with SQLiteExplorer(self.db_path) as db:
-            matches = db.search("Alice", tables=["products"])
-            self.assertEqual(len(matches), 0)
+            matches = db.search("Alice", tables=["v_users", "v_broken"])
+            # A broken view is skipped without breaking table searches
+            self.assertGreater(len(db.search("Alice")), 0)
+        self.assertEqual(len(matches), 1)
+        self.assertEqual(matches[0]["table"], "v_users")
+        self.assertEqual(matches[0]["matched_columns"], ["name"])
 
     def test_search_no_match(self):
         """Test search with no matches."""
-        with SQLiteExplorer(self.db_path) as db:
-            matches = db.search("XYZNONEXISTENT123")
-            self.assertEqual(len(matches), 0)
+        db = self.db
+        matches = db.search("XYZNONEXISTENT123")
+        self.assertEqual(len(matches), 0)
 
     def test_search_with_limit(self):
         """Test search respects limit."""
-        with SQLiteExplorer(self.db_path) as db:
-            matches = db.search("e", limit=2)  # 'e' appears in many names
-            self.assertLessEqual(len(matches), 2)
+        db = self.db
+        matches = db.search("e", limit=2)  # 'e' appears in many names
+        self.assertLessEqual(len(matches), 2)
 
     def test_search_matched_columns(self):
         """Test search reports matched columns."""
+        db = self.db
+        matches = db.search("alice@example.com")
+        if matches:
+            self.assertIn("email", matches[0]["matched_columns"])
+
+    def test_search_column_type_classification(self):
+        """Test which declared types are searched."""
+        conn = sqlite3.connect(self.db_path)
+        conn.execute(
+            "CREATE TABLE typed (a INTEGER, b real, c BLOB, d VARCHAR(20), "
+            "e, f JSON, g BOOLEAN)"
+        )
+        conn.execute("INSERT INTO typed VALUES "
+                     "('zq', 'zq', 'zq', 'zq', 'zq', 'zq', 'zq')")
+        conn.commit()
+        conn.close()
         with SQLiteExplorer(self.db_path) as db:
-            matches = db.search("alice@example.com")
-            if matches:
-                self.assertIn("email", matches[0]["matched_columns"])
+            matches = db.search("zq", tables=["typed"])
+            self.assertEqual(matches[0]["matched_columns"], ["d", "e", "f"])
+
+    def test_search_skips_row_counts(self):
+        """Test searching all tables does not COUNT(*) each table."""
+        db = self.db
+        statements = []
+        db._connect().set_trace_callback(statements.append)
+        matches = db.search("Widget", limit=1)
+        self.assertEqual(len(matches), 1)
+        self.assertFalse(
+            [sql for sql in statements if "COUNT(*)" in sql]
+        )
+
+    def test_search_wildcards_are_literal(self):
+        """Test LIKE wildcards in the term are matched literally."""
+        db = self.db
+        self.assertEqual(db.search("A%e"), [])
+        self.assertEqual(db.search("_"), [])
+
+    def test_search_fts_matches_scan(self):
+        """Test the FTS5 index returns the same matches as a scan."""
+        db = self.db
+        scan = db.search("example")
+        fts = db.search("EXAMPLE", use_fts=True)
+        self.assertEqual(fts, scan)
+        self.assertEqual(len(fts), 4)
+        self.assertEqual(fts[0]["matched_columns"], ["email"])
+        # Short terms fall back to the scan
+        self.assertEqual(db.search("e", limit=3, use_fts=True),
+                         db.search("e", limit=3))
+
+    def test_search_fts_sees_other_writers(self):
+        """Test the FTS5 index is rebuilt after another connection commits."""
+        with SQLiteExplorer(self.db_path) as db:
+            self.assertEqual(db.search("Zanzibar", use_fts=True), [])
+            conn = sqlite3.connect(self.db_path)
+            conn.execute(
+                "INSERT INTO products VALUES (5, 'Zanzibar', 1.0, 'Z', 1)"
+            )
+            conn.commit()
+            conn.close()
+            matches = db.search("Zanzibar", use_fts=True)
+            self.assertEqual(len(matches), 1)
+            self.assertEqual(matches[0]["matched_columns"], ["name"])
+            # Unchanged database: the index is reused, not rebuilt
+            self.assertIs(db._search_index(db._connect().cursor()),
+                          db._search_index(db._connect().cursor()))
 
 
 class TestGetSize(BaseDBTest):
     """Test get_size() functionality."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Share one explorer across this class's read-only tests."""
+        super().setUpClass()
+        cls._open_shared_db()
+
     def test_size_returns_dict(self):
         """Test size returns a dictionary."""
-        with SQLiteExplorer(self.db_path) as db:
-            size = db.get_size()
-            self.assertIsInstance(size, dict)
+        db = self.db
+        size = db.get_size()
+        self.assertIsInstance(size, dict)
 
     def test_size_has_file_size(self):
         """Test size includes file size."""
-        with SQLiteExplorer(self.db_path) as db:
-            size = db.get_size()
-            self.assertGreater(size["file_size"], 0)
+        db = self.db
+        size = db.get_size()
+        self.assertGreater(size["file_size"], 0)
 
     def test_size_has_tables(self):
         """Test size includes table breakdown."""
-        with SQLiteExplorer(self.db_path) as db:
-            size = db.get_size()
-            self.assertEqual(len(size["tables"]), 3)
+        db = self.db
+        size = db.get_size()
+        self.assertEqual(len(size["tables"]), 3)
 
     def test_size_page_info(self):
         """Test size includes page information."""
-        with SQLiteExplorer(self.db_path) as db:
-            size = db.get_size()
-            self.assertGreater(size["page_count"], 0)
-            self.assertGreater(size["page_size"], 0)
+        db = self.db
+        size = db.get_size()
+        self.assertGreater(size["page_count"], 0)
+        self.assertGreater(size["page_size"], 0)
+
+    def test_size_tables_from_page_accounting(self):
+        """Test table sizes are whole pages of the table's b-tree."""
+        db = self.db
+        size = db.get_size()
+        for tbl in size["tables"]:
+            self.assertEqual(
+                tbl["estimated_data_size"] % size["page_size"], 0
+            )
+            self.assertGreater(tbl["estimated_data_size"], 0)
 
 
 class TestDiff(BaseDBTest):
@@ -748,18 +1365,21 @@ class TestDiff(BaseDBTest):
 
     def test_diff_identical(self):
         """Test diffing identical databases."""
-        with SQLiteExplorer(self.db_path) as db:
+        # The same-file fast path never snapshots either database
+        with SQLiteExplorer(self.db_path) as db, \
+                unittest.mock.patch.object(SQLiteExplorer, "_diff_snapshot",
+                                           side_effect=AssertionError):
             result = db.diff(self.db_path)
             self.assertTrue(result["identical_schema"])
+            self.assertEqual(result["common_tables"], 3)
+            self.assertEqual(result["table_differences"], [])
 
     def test_diff_different_tables(self):
         """Test diffing databases with different tables."""
         # Create a different database
-        other_path = os.path.join(self.temp_dir, "other.db")
-        conn = sqlite3.connect(other_path)
-        conn.execute("CREATE TABLE different_table (id INTEGER PRIMARY KEY)")
-        conn.commit()
-        conn.close()
+        other_path = self.tmp_path("other.db")
+        _build_db(other_path,
+                  ["CREATE TABLE different_table (id INTEGER PRIMARY KEY)"])
 
         with SQLiteExplorer(self.db_path) as db:
             result = db.diff(other_path)
@@ -792,29 +1412,48 @@ class TestVacuum(BaseDBTest):
             self.assertGreater(result["before_size"], 0)
             self.assertGreater(result["after_size"], 0)
 
+    def test_vacuum_into(self):
+        """Test VACUUM INTO writes a usable copy and leaves the original."""
+        copy_path = self.tmp_path("compact.db")
+        before = Path(self.db_path).read_bytes()
+        with SQLiteExplorer(self.db_path) as db:
+            result = db.vacuum(into=copy_path)
+            self.assertEqual(result["into"], copy_path)
+            self.assertEqual(result["after_size"],
+                             os.path.getsize(copy_path))
+        self.assertEqual(Path(self.db_path).read_bytes(), before)
+        with SQLiteExplorer(copy_path) as copy:
+            self.assertEqual(len(copy.get_tables()), 3)
+
 
 class TestEdgeCases(BaseDBTest):
     """Test edge cases and special scenarios."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Share one explorer across this class's read-only tests."""
+        super().setUpClass()
+        cls._open_shared_db()
+
     def test_empty_database(self):
         """Test with empty database (no tables)."""
-        empty_path = os.path.join(self.temp_dir, "empty.db")
-        conn = sqlite3.connect(empty_path)
-        conn.close()
+        empty_path = self.tmp_path("empty.db")
+        _build_db(empty_path, [])
 
         with SQLiteExplorer(empty_path) as db:
             tables = db.get_tables()
             self.assertEqual(len(tables), 0)
             info = db.get_info()
             self.assertEqual(info["table_count"], 0)
+            # Conditional SUMs over an empty sqlite_master still give 0
+            for key in ("index_count", "view_count", "trigger_count"):
+                self.assertEqual(info[key], 0)
 
     def test_empty_table(self):
         """Test with table that has no rows."""
-        empty_path = os.path.join(self.temp_dir, "empty_table.db")
-        conn = sqlite3.connect(empty_path)
-        conn.execute("CREATE TABLE empty (id INTEGER PRIMARY KEY, name TEXT)")
-        conn.commit()
-        conn.close()
+        empty_path = self.tmp_path("empty_table.db")
+        _build_db(empty_path,
+                  ["CREATE TABLE empty (id INTEGER PRIMARY KEY, name TEXT)"])
 
         with SQLiteExplorer(empty_path) as db:
             result = db.browse("empty")
@@ -824,46 +1463,42 @@ class TestEdgeCases(BaseDBTest):
 
     def test_blob_data(self):
         """Test handling of BLOB data."""
-        with SQLiteExplorer(self.db_path) as db:
-            # Bob has a BLOB avatar
-            result = db.browse("users", where="name = 'Bob Jones'")
-            self.assertEqual(len(result["rows"]), 1)
-            # BLOB should be in the row (avatar column index 6)
-            avatar = result["rows"][0][6]
-            self.assertIsInstance(avatar, bytes)
+        db = self.db
+        # Bob has a BLOB avatar
+        result = db.browse("users", where="name = 'Bob Jones'")
+        self.assertEqual(len(result["rows"]), 1)
+        # BLOB should be in the row (avatar column index 6)
+        avatar = result["rows"][0][6]
+        self.assertIsInstance(avatar, bytes)
 
     def test_null_values_in_browse(self):
         """Test NULL values are handled in browse."""
-        with SQLiteExplorer(self.db_path) as db:
-            result = db.browse("users", where="email IS NULL")
-            self.assertEqual(len(result["rows"]), 1)
-            self.assertEqual(result["rows"][0][1], "Eve Adams")
+        db = self.db
+        result = db.browse("users", where="email IS NULL")
+        self.assertEqual(len(result["rows"]), 1)
+        self.assertEqual(result["rows"][0][1], "Eve Adams")
 
     def test_very_long_string(self):
         """Test handling of very long string values."""
-        long_path = os.path.join(self.temp_dir, "long.db")
-        conn = sqlite3.connect(long_path)
-        conn.execute("CREATE TABLE data (id INTEGER PRIMARY KEY, text TEXT)")
-        conn.execute("INSERT INTO data VALUES (1, ?)", ("A" * 10000,))
-        conn.commit()
-        conn.close()
+        long_path = self.tmp_path("long.db")
+        _build_db(long_path, [
+            "CREATE TABLE data (id INTEGER PRIMARY KEY, text TEXT)",
+            ("INSERT INTO data VALUES (1, ?)", [("A" * 10000,)]),
+        ])
 
         with SQLiteExplorer(long_path) as db:
             result = db.browse("data")
-            self.assertEqual(len(result["rows"]), 1)
-            # Export should contain full data
-            content = db.export_table("data", fmt="json")
-            data = json.loads(content)
-            self.assertEqual(len(data[0]["text"]), 10000)
+        self.assertEqual(len(result["rows"]), 1)
+        self.assertEqual(len(result["rows"][0][1]), 10000)
 
     def test_special_characters_in_data(self):
         """Test handling of special characters."""
-        special_path = os.path.join(self.temp_dir, "special.db")
-        conn = sqlite3.connect(special_path)
-        conn.execute("CREATE TABLE data (id INTEGER PRIMARY KEY, text TEXT)")
-        conn.execute("INSERT INTO data VALUES (1, ?)", ('He said "hello" & <goodbye>',))
-        conn.commit()
-        conn.close()
+        special_path = self.tmp_path("special.db")
+        _build_db(special_path, [
+            "CREATE TABLE data (id INTEGER PRIMARY KEY, text TEXT)",
+            ("INSERT INTO data VALUES (1, ?)",
+             [('He said "hello" & <goodbye>',)]),
+        ])
 
         with SQLiteExplorer(special_path) as db:
             result = db.browse("data")
@@ -871,14 +1506,8 @@ class TestEdgeCases(BaseDBTest):
 
     def test_many_columns(self):
         """Test table with many columns."""
-        many_path = os.path.join(self.temp_dir, "many_cols.db")
-        conn = sqlite3.connect(many_path)
-        cols = ", ".join("col%d TEXT" % i for i in range(50))
-        conn.execute("CREATE TABLE wide (id INTEGER PRIMARY KEY, %s)" % cols)
-        vals = ", ".join("'val%d'" % i for i in range(50))
-        conn.execute("INSERT INTO wide VALUES (1, %s)" % vals)
-        conn.commit()
-        conn.close()
+        many_path = self.tmp_path("many_cols.db")
+        _build_db(many_path, [_WIDE_CREATE, _WIDE_INSERT])
 
         with SQLiteExplorer(many_path) as db:
             schema = db.get_schema("wide")
@@ -888,68 +1517,69 @@ class TestEdgeCases(BaseDBTest):
 class TestIntegration(BaseDBTest):
     """Integration tests for full workflows."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Share one explorer across this class's read-only tests."""
+        super().setUpClass()
+        cls._open_shared_db()
+        # The fixture's tables; get_tables() is covered by TestGetTables
+        cls._table_names = ["users", "products", "orders"]
+
     def test_full_inspection_workflow(self):
         """Test complete inspection: info -> tables -> schema -> browse."""
-        with SQLiteExplorer(self.db_path) as db:
-            # Step 1: Info
-            info = db.get_info()
-            self.assertEqual(info["table_count"], 3)
+        db = self.db
+        # Step 1: Info
+        info = db.get_info()
+        self.assertEqual(info["table_count"], 3)
 
-            # Step 2: Tables
-            tables = db.get_tables()
-            self.assertEqual(len(tables), 3)
+        # Step 2: Tables
+        tables = db.get_tables()
+        self.assertEqual(len(tables), 3)
 
-            # Step 3: Schema
-            schema = db.get_schema("users")
-            self.assertGreater(len(schema[0]["columns"]), 0)
+        # Step 3: Schema
+        schema = db.get_schema("users")
+        self.assertGreater(len(schema[0]["columns"]), 0)
 
-            # Step 4: Browse
-            result = db.browse("users", limit=3)
-            self.assertEqual(len(result["rows"]), 3)
+        # Step 4: Browse
+        result = db.browse("users", limit=3)
+        self.assertEqual(len(result["rows"]), 3)
 
     def test_export_all_formats(self):
         """Test exporting in all formats."""
-        with SQLiteExplorer(self.db_path) as db:
-            csv_out = db.export_table("products", fmt="csv")
-            json_out = db.export_table("products", fmt="json")
-            md_out = db.export_table("products", fmt="md")
+        db = self.db
+        csv_out = db.export_table("products", fmt="csv")
+        json_out = db.export_table("products", fmt="json")
+        md_out = db.export_table("products", fmt="md")
 
-            self.assertIn("Widget A", csv_out)
-            self.assertIn("Widget A", json_out)
-            self.assertIn("Widget A", md_out)
+        self.assertIn("Widget A", csv_out)
+        self.assertIn("Widget A", json_out)
+        self.assertIn("Widget A", md_out)
 
-            # Verify JSON is valid
-            data = json.loads(json_out)
-            self.assertEqual(len(data), 4)
+        # Verify JSON is valid
+        data = _json_loads(json_out)
+        self.assertEqual(len(data), 4)
 
     def test_search_and_browse(self):
         """Test search then browse workflow."""
-        with SQLiteExplorer(self.db_path) as db:
-            # Search
-            matches = db.search("Electronics")
-            self.assertGreater(len(matches), 0)
+        db = self.db
+        # Search
+        matches = db.search("Electronics")
+        self.assertGreater(len(matches), 0)
 
-            # Browse matching table
-            result = db.browse("products", where="category = 'Electronics'")
-            self.assertEqual(len(result["rows"]), 2)
+        # Browse matching table
+        result = db.browse("products", where="category = 'Electronics'")
+        self.assertEqual(len(result["rows"]), 2)
 
     def test_stats_all_tables(self):
         """Test getting stats for all tables."""
-        with SQLiteExplorer(self.db_path) as db:
-            tables = db.get_tables()
-            for t in tables:
-                stats = db.get_stats(t["name"])
-                self.assertGreater(len(stats), 0)
+        db = self.db
+        empty = [name for name in self._table_names if not db.get_stats(name)]
+        self.assertEqual(empty, [])
 
     def test_large_data(self):
         """Test with a larger dataset."""
-        large_path = os.path.join(self.temp_dir, "large.db")
-        conn = sqlite3.connect(large_path)
-        conn.execute("CREATE TABLE data (id INTEGER PRIMARY KEY, value TEXT, num REAL)")
-        rows = [(i, "item_%d" % i, float(i) * 1.5) for i in range(1000)]
-        conn.executemany("INSERT INTO data VALUES (?, ?, ?)", rows)
-        conn.commit()
-        conn.close()
+        large_path = self.tmp_path("large.db")
+        _clone_db(_LARGE_TEMPLATE, large_path)
 
         with SQLiteExplorer(large_path) as db:
             tables = db.get_tables()
@@ -962,18 +1592,24 @@ class TestIntegration(BaseDBTest):
             num_stat = next(s for s in stats if s["column"] == "num")
             self.assertIsNotNone(num_stat["avg"])
 
+    def test_main_returns_in_process(self):
+        """Test main() returns its exit code instead of ending the process."""
+        argv = ["sqliteexplorer", "tables", self.db_path]
+        with unittest.mock.patch.object(sys, "argv", argv), \
+                redirect_stdout(io.StringIO()) as out:
+            self.assertEqual(main(), 0)
+        self.assertIn("products", out.getvalue())
+
     def test_multiple_databases(self):
         """Test working with multiple databases in sequence."""
-        db2_path = os.path.join(self.temp_dir, "db2.db")
-        conn = sqlite3.connect(db2_path)
-        conn.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, data TEXT)")
-        conn.execute("INSERT INTO items VALUES (1, 'test')")
-        conn.commit()
-        conn.close()
+        db2_path = self.tmp_path("db2.db")
+        _build_db(db2_path, [
+            "CREATE TABLE items (id INTEGER PRIMARY KEY, data TEXT)",
+            "INSERT INTO items VALUES (1, 'test')",
+        ])
 
-        with SQLiteExplorer(self.db_path) as db1:
-            tables1 = db1.get_tables()
-            self.assertEqual(len(tables1), 3)
+        tables1 = self.db.get_tables()
+        self.assertEqual(len(tables1), 3)
 
         with SQLiteExplorer(db2_path) as db2:
             tables2 = db2.get_tables()
@@ -984,13 +1620,40 @@ class TestIntegration(BaseDBTest):
 # TEST RUNNER
 # =============================================================================
 
-def run_tests():
-    """Run all tests with clear output."""
-    print("=" * 70)
-    print("TESTING: SQLiteExplorer v%s" % __version__ if '__version__' in dir() else "1.0.0")
-    print("=" * 70)
+def _load_class(cls):
+    """
+    Build a suite of a test class's own test methods.
+
+    Equivalent to TestLoader.loadTestsFromTestCase() for this file, whose
+    base classes define no tests, but reads only the class's own __dict__
+    instead of walking dir() over the whole MRO.
+    """
+    return unittest.TestSuite(
+        cls(name) for name in sorted(vars(cls))
+        if name.startswith("test") and callable(getattr(cls, name))
+    )
+
+
+def _run_one_class(name):
+    """
+    Run one test class (in a worker process) and report its outcome.
+
+    Returns:
+        (runner output, tests run, failure count, error count).
+    """
+    stream = io.StringIO()
+    suite = _load_class(globals()[name])
+    result = unittest.TextTestRunner(stream=stream, verbosity=2).run(suite)
+    return (stream.getvalue(), result.testsRun, len(result.failures),
+            len(result.errors))
+
+
+def run_tests(parallel=False):
+    """Run all tests with clear output (one process per class if parallel)."""
+    print(_BAR)
+    print(f"TESTING: SQLiteExplorer v{__version__}")
+    print(_BAR)
 
-    loader = unittest.TestLoader()
     suite = unittest.TestSuite()
 
     # Add all test classes
@@ -1013,25 +1676,41 @@ def run_tests():
         TestIntegration,
     ]
 
-    for cls in test_classes:
-        suite.addTests(loader.loadTestsFromTestCase(cls))
-
-    runner = unittest.TextTestRunner(verbosity=2)
-    result = runner.run(suite)
+    if parallel:
+        import multiprocessing
+
+        # Classes share no files, so each can run in its own process
+        with multiprocessing.Pool(os.cpu_count()) as pool:
+            outcomes = pool.map(_run_one_class,
+                                [cls.__name__ for cls in test_classes])
+        for output, _, _, _ in outcomes:
+            sys.stderr.write(output)
+        tests_run = sum(o[1] for o in outcomes)
+        failures = sum(o[2] for o in outcomes)
+        errors = sum(o[3] for o in outcomes)
+    else:
+        for cls in test_classes:
+            suite.addTests(_load_class(cls))
+
+        runner = unittest.TextTestRunner(verbosity=2)
+        result = runner.run(suite)
+        tests_run = result.testsRun
+        failures = len(result.failures)
+        errors = len(result.errors)
 
     # Summary
-    print("\n" + "=" * 70)
-    passed = result.testsRun - len(result.failures) - len(result.errors)
-    print("RESULTS: %d tests run" % result.testsRun)
+    print("\n" + _BAR)
+    passed = tests_run - failures - errors
+    print("RESULTS: %d tests run" % tests_run)
     print("[OK] Passed: %d" % passed)
-    if result.failures:
-        print("[X] Failed: %d" % len(result.failures))
-    if result.errors:
-        print("[X] Errors: %d" % len(result.errors))
-    print("=" * 70)
+    if failures:
+        print("[X] Failed: %d" % failures)
+    if errors:
+        print("[X] Errors: %d" % errors)
+    print(_BAR)
 
-    return 0 if result.wasSuccessful() else 1
+    return 0 if not failures and not errors else 1
 
 
 if __name__ == "__main__":
-    sys.exit(run_tests())
+    sys.exit(run_tests(parallel="--parallel" in sys.argv[1:]))